@@ -1,21 +1,31 @@
 #!/usr/bin/env python3
 """
 Add Infrastructure and Technological issue connections to issue-issue-connections.json
+
+With --check nothing is written to the connections file: the curated
+additions still missing from it are counted, the file is validated against
+the issue ids in public/data.json, and --report writes both as JSON (the
+data pipeline runs this mode; merging stays a manual step). Without
+public/data.json (a fresh clone, before `pnpm extract-data`) the
+unknown-issue check is skipped with a warning.
+
+Run from anywhere: python3 scripts/add-infra-tech-connections.py [--check [--report path]]
 """
+from __future__ import annotations
+
+import argparse
+import copy
 import json
 from pathlib import Path
 
+from wiki_corpus import now_iso
+
 # Paths
 ROOT = Path(__file__).parent.parent
 DATA_FILE = ROOT / "public" / "data.json"
 CONNECTIONS_FILE = ROOT / "issue-issue-connections.json"
 
-# Read existing data
-with open(DATA_FILE, 'r') as f:
-    data = json.load(f)
-
-with open(CONNECTIONS_FILE, 'r') as f:
-    connections_data = json.load(f)
+RELATIONSHIP_TYPES = {"causal", "reinforcing", "thematic", "sequential"}
 
 # Comprehensive Infrastructure and Technological connections
 new_connections = [
@@ -642,19 +652,135 @@ new_connections = [
     }
 ]
 
-# Append new connections to existing data
-connections_data['connections'].extend(new_connections)
 
-# Update metadata
-connections_data['metadata']['totalConnections'] = sum(
-    len(conn['connectedTo']) for conn in connections_data['connections']
-)
-connections_data['metadata']['generatedAt'] = "2025-11-21T17:00:00Z"
+def merge_connections(connections_data: dict, additions: list[dict]) -> int:
+    """
+    Merge connection objects into connections_data in place.
+    Targets already present for an issue are skipped, so re-running is a no-op.
+    Returns the number of targets added.
+    """
+    by_issue = {conn['issueId']: conn for conn in connections_data['connections']}
+    added = 0
+
+    for addition in additions:
+        existing = by_issue.get(addition['issueId'])
+        if existing is None:
+            existing = {**addition, 'connectedTo': []}
+            connections_data['connections'].append(existing)
+            by_issue[addition['issueId']] = existing
+
+        known_targets = {target['targetId'] for target in existing['connectedTo']}
+        for target in addition['connectedTo']:
+            if target['targetId'] not in known_targets:
+                existing['connectedTo'].append(target)
+                known_targets.add(target['targetId'])
+                added += 1
+
+    connections_data['metadata']['totalConnections'] = sum(
+        len(conn['connectedTo']) for conn in connections_data['connections']
+    )
+    return added
+
+
+def validate_connections(connections_data: dict, issue_ids: set[str]) -> list[str]:
+    """Return human-readable problems: unknown issues, bad relationship types, duplicates."""
+    problems: list[str] = []
+    seen_issues: set[str] = set()
+
+    for conn in connections_data['connections']:
+        issue_id = conn['issueId']
+        if issue_id in seen_issues:
+            problems.append(f"{issue_id}: duplicate connection object")
+        seen_issues.add(issue_id)
+        if issue_ids and issue_id not in issue_ids:
+            problems.append(f"{issue_id}: unknown source issue")
+
+        seen_targets: set[str] = set()
+        for target in conn['connectedTo']:
+            target_id = target.get('targetId', '')
+            if target_id in seen_targets:
+                problems.append(f"{issue_id} → {target_id}: duplicate target")
+            seen_targets.add(target_id)
+            if issue_ids and target_id not in issue_ids:
+                problems.append(f"{issue_id} → {target_id}: unknown target issue")
+            if target.get('relationshipType') not in RELATIONSHIP_TYPES:
+                problems.append(f"{issue_id} → {target_id}: missing or unknown relationshipType")
+
+    return problems
+
+
+def issue_ids_from_data(data: dict) -> set[str]:
+    ids = {node['id'] for node in data.get('nodes', []) if node.get('type') == 'issue'}
+    ids.update(data.get('issueIdRedirects', {}).keys())
+    return ids
+
+
+def check(connections_data: dict, issue_ids: set[str], report_path: str | None) -> None:
+    pending = merge_connections(copy.deepcopy(connections_data), new_connections)
+    problems = validate_connections(connections_data, issue_ids)
+
+    if report_path:
+        report = {
+            'generatedAt': now_iso(),
+            'connectionObjects': len(connections_data['connections']),
+            'totalConnections': sum(len(conn['connectedTo']) for conn in connections_data['connections']),
+            'pendingAdditions': pending,
+            'problems': problems,
+        }
+        Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ {len(connections_data['connections'])} issue connection objects checked")
+    if pending:
+        print(f"  {pending} curated connections not merged yet (run without --check to add them)")
+    print(f"{'⚠' if problems else '✓'} {len(problems)} validation problem(s)")
+    for problem in problems[:20]:
+        print(f"  {problem}")
+    if report_path:
+        print(f"✓ Wrote {report_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='validate only; never write the connections file')
+    parser.add_argument('--report', metavar='PATH', help='with --check, write the findings as JSON')
+    args = parser.parse_args()
+
+    try:
+        with open(DATA_FILE, 'r') as f:
+            issue_ids = issue_ids_from_data(json.load(f))
+    except FileNotFoundError:
+        print(f"⚠ {DATA_FILE.relative_to(ROOT)} not found (run pnpm extract-data); "
+              "issue ids are not checked")
+        issue_ids = set()
+
+    with open(CONNECTIONS_FILE, 'r') as f:
+        connections_data = json.load(f)
+
+    if args.check:
+        check(connections_data, issue_ids, args.report)
+        return
+
+    added = merge_connections(connections_data, new_connections)
+
+    # Save updated connections; an unchanged file keeps its old timestamp
+    if added:
+        connections_data['metadata']['generatedAt'] = now_iso()
+        with open(CONNECTIONS_FILE, 'w') as f:
+            json.dump(connections_data, f, indent=2)
+        print(f"✓ Added {added} new connections from {len(new_connections)} issue connection objects")
+    else:
+        print(f"✓ All {len(new_connections)} issue connection objects already merged; file left unchanged")
+    print(f"✓ Total connections now: {connections_data['metadata']['totalConnections']}")
+    print(f"✓ Total issues with connections: {len(connections_data['connections'])}")
+
+    problems = validate_connections(connections_data, issue_ids)
+    if problems:
+        print(f"\n⚠ {len(problems)} validation problem(s):")
+        for problem in problems[:20]:
+            print(f"  {problem}")
 
-# Save updated connections
-with open(CONNECTIONS_FILE, 'w') as f:
-    json.dump(connections_data, f, indent=2)
 
-print(f"✓ Added {len(new_connections)} new issue connection objects")
-print(f"✓ Total connections now: {connections_data['metadata']['totalConnections']}")
-print(f"✓ Total issues with connections: {len(connections_data['connections'])}")
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,35 @@
 """
 Batch apply mechanics tags to issue wiki pages.
 Run from shadow-workipedia root: python3 scripts/apply-mechanics-tags.py
+
+Profiling:
+  --profile              per-stage timers (listdir, read, frontmatter, match,
+                         rewrite, write) and the slowest files
+  --pstats out.pstats    also dump a cProfile run (implies --profile)
+  --trace out.json       also write a Chrome trace (implies --profile)
+
+Watch mode:
+  --watch                stay running; when a wiki/issues page is saved, retag
+                         it and revalidate just that page and its connection
+                         entries (polls every --interval seconds)
+
+A changed page is only handled once its mtime has held for one poll, so a
+page caught mid-save is not retagged and written back half-finished. A page
+or connections file that cannot be read (deleted, half-written) keeps its
+previous state and is retried on the next poll.
 """
+import argparse
+import json
 import os
 import re
 import sys
+import time
+
+from stage_profile import NULL_PROFILER, StageProfiler
+from wiki_corpus import as_list, load_script, parse_frontmatter
+
+MECHANICS_DIR = "wiki/mechanics"
+CONNECTIONS_FILE = "issue-issue-connections.json"
 
 # Valid mechanics and their patterns (lowercase keywords to match)
 MECHANICS_PATTERNS = {
@@ -275,6 +300,30 @@ ISSUE_MECHANICS = {
     ],
 }
 
+# Ids used above that have no wiki/mechanics page, mapped to the page that covers them
+MECHANIC_ALIASES = {
+    "mechanic--adverse-selection--adverse-selection-in-cyber-insurance": "mechanic--adverse-selection--adverse-selection",
+    "mechanic--bidirectional-feedback--bidirectional-feedback": "mechanic--feedback-loop--feedback-loop",
+    "mechanic--cascade--epistomological-collapse-cascade": "mechanic--cascade--cascade",
+    "mechanic--chokepoint-concentration--chokepoint-concentration": "mechanic--concentration--concentration",
+    "mechanic--economic-lock-in--economic-lock-in": "mechanic--lock-in--lock-in",
+    "mechanic--externality--externality-pricing": "mechanic--externality--externality",
+    "mechanic--geographic-concentration--geographic-concentration": "mechanic--concentration--concentration",
+    "mechanic--irreversible--water-extraction-irreversibility": "mechanic--irreversibility--irreversibility",
+    "mechanic--lobbying--lobbying-intensity-response": "mechanic--lobbying--lobbying",
+    "mechanic--lock-in-effect--lock-in-effect": "mechanic--lock-in--lock-in",
+    "mechanic--market-failure--geographic-market-failure": "mechanic--market-failure--market-failure",
+    "mechanic--moral-hazard--moral-hazard-from-coverage": "mechanic--moral-hazard--moral-hazard",
+    "mechanic--path-dependency--path-dependency-lock-in": "mechanic--lock-in--lock-in",
+    "mechanic--regulatory-capture--regulatory-capture-by-incumbents": "mechanic--regulatory-capture--regulatory-capture",
+    "mechanic--threshold--confidencethreshold": "mechanic--threshold--threshold",
+    "mechanic--tipping-point--tipping-point": "mechanic--irreversibility--irreversibility",
+}
+
+def canonical_mechanics(mechanics: list[str]) -> list[str]:
+    """Map aliases to their wiki/mechanics ids, dropping duplicates and keeping order."""
+    return list(dict.fromkeys(MECHANIC_ALIASES.get(m, m) for m in mechanics))
+
 def match_mechanics(content: str) -> list[str]:
     """Find mechanics that match content patterns."""
     content_lower = content.lower()
@@ -288,53 +337,245 @@ def match_mechanics(content: str) -> list[str]:
 
     return sorted(matched)
 
-def process_issue(filepath: str) -> tuple[str, list[str], bool]:
+def process_issue(filepath: str, profiler: StageProfiler = NULL_PROFILER) -> tuple[str, list[str], bool]:
     """Process a single issue file. Returns (slug, mechanics, was_updated)."""
     slug = os.path.basename(filepath).replace('.md', '')
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with profiler.stage('read', slug):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
 
     # Check if already has mechanics
-    if not re.search(r'^mechanics:\s*\[\]', content, re.MULTILINE):
+    with profiler.stage('frontmatter', slug):
+        needs_tags = re.search(r'^mechanics:\s*\[\]', content, re.MULTILINE)
+    if not needs_tags:
         return slug, [], False
 
     # Get mechanics - use override if available, otherwise match from content
-    if slug in ISSUE_MECHANICS:
-        mechanics = ISSUE_MECHANICS[slug]
-    else:
-        mechanics = match_mechanics(content)
+    with profiler.stage('match', slug):
+        if slug in ISSUE_MECHANICS:
+            mechanics = canonical_mechanics(ISSUE_MECHANICS[slug])
+        else:
+            mechanics = sorted(canonical_mechanics(match_mechanics(content)))
 
     if not mechanics:
         return slug, [], False
 
-    # Format mechanics as YAML list
-    mechanics_yaml = "mechanics:\n" + "\n".join(f"  - {m}" for m in mechanics)
+    with profiler.stage('rewrite', slug):
+        # Format mechanics as YAML list
+        mechanics_yaml = "mechanics:\n" + "\n".join(f"  - {m}" for m in mechanics)
 
-    # Replace mechanics: [] with the list
-    new_content = re.sub(r'^mechanics:\s*\[\]', mechanics_yaml, content, count=1, flags=re.MULTILINE)
+        # Replace mechanics: [] with the list
+        new_content = re.sub(r'^mechanics:\s*\[\]', mechanics_yaml, content, count=1, flags=re.MULTILINE)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    with profiler.stage('write', slug):
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(new_content)
 
     return slug, mechanics, True
 
+class CorpusIndex:
+    """Resident view of wiki/issues plus the connection entries that touch each issue."""
+
+    def __init__(self, issues_dir: str):
+        self.issues_dir = issues_dir
+        self.mtimes: dict[str, int] = {}
+        self.mechanic_ids: set[str] = set()
+        self.connections_mtime = 0
+        self.connections_error = ''
+        self.connections: list[dict] = []
+        self.outgoing: dict[str, list[dict]] = {}
+        self.incoming: dict[str, list[tuple[str, dict]]] = {}
+        self.validator = load_script('add-infra-tech-connections')
+
+        for entry in os.scandir(MECHANICS_DIR) if os.path.isdir(MECHANICS_DIR) else []:
+            if entry.name.endswith('.md') and not entry.name.startswith('_'):
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    frontmatter, _ = parse_frontmatter(f.read())
+                self.mechanic_ids.add(str(frontmatter.get('id', entry.name[:-3])))
+        self.mtimes = self.scan()
+        self.load_connections()
+
+    @property
+    def issue_ids(self) -> set[str]:
+        return {filename[:-3] for filename in self.mtimes}
+
+    def scan(self) -> dict[str, int]:
+        mtimes = {}
+        for entry in os.scandir(self.issues_dir):
+            if entry.name.endswith('.md') and not entry.name.startswith('_'):
+                try:
+                    mtimes[entry.name] = entry.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue  # removed between listing and stat
+        return mtimes
+
+    def load_connections(self) -> bool:
+        """
+        (Re)load issue-issue-connections.json if it changed. Returns True when
+        reloaded; an unreadable file keeps the previous connections, records
+        why in connections_error and is retried on the next call.
+        """
+        try:
+            mtime = os.stat(CONNECTIONS_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self.connections_mtime:
+            return False
+        try:
+            with open(CONNECTIONS_FILE, 'r', encoding='utf-8') as f:
+                connections = json.load(f).get('connections', [])
+        except (OSError, ValueError) as error:
+            self.connections_error = str(error)
+            return False
+        outgoing: dict[str, list[dict]] = {}
+        incoming: dict[str, list[tuple[str, dict]]] = {}
+        for conn in connections:
+            outgoing.setdefault(conn['issueId'], []).append(conn)
+            for target in conn['connectedTo']:
+                incoming.setdefault(target.get('targetId', ''), []).append((conn['issueId'], target))
+        self.connections, self.outgoing, self.incoming = connections, outgoing, incoming
+        self.connections_mtime = mtime
+        self.connections_error = ''
+        return True
+
+    def validate(self, slug: str) -> list[str]:
+        """Problems for one issue: its frontmatter plus every connection entry it appears in."""
+        issue_ids = self.issue_ids
+        problems: list[str] = []
+        path = os.path.join(self.issues_dir, f"{slug}.md")
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                frontmatter, _ = parse_frontmatter(f.read())
+            if frontmatter.get('id') != slug:
+                problems.append(f"{slug}: frontmatter id is {frontmatter.get('id')!r}")
+            for mechanic in as_list(frontmatter.get('mechanics')):
+                if self.mechanic_ids and mechanic not in self.mechanic_ids:
+                    problems.append(f"{slug}: unknown mechanic {mechanic}")
+            for target in as_list(frontmatter.get('connections')):
+                if str(target) not in issue_ids:
+                    problems.append(f"{slug}: connections lists unknown issue {target}")
+
+        subset = {'connections': self.outgoing.get(slug, [])}
+        problems.extend(self.validator.validate_connections(subset, issue_ids))
+        if slug not in issue_ids:
+            for source, target in self.incoming.get(slug, []):
+                problems.append(f"{source} → {slug}: target page no longer exists")
+        return problems
+
+def refresh_page(index: CorpusIndex, filename: str) -> None:
+    start = time.perf_counter()
+    slug = filename[:-3]
+    filepath = os.path.join(index.issues_dir, filename)
+
+    retagged = []
+    if os.path.exists(filepath):
+        _, retagged, was_updated = process_issue(filepath)
+        if was_updated:
+            # Our own write must not trigger another refresh
+            index.mtimes[filename] = os.stat(filepath).st_mtime_ns
+
+    problems = index.validate(slug)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    status = "✓" if not problems else "✗"
+    tagged = f", tagged {len(retagged)} mechanics" if retagged else ""
+    print(f"{status} {slug}{tagged} ({elapsed:.1f} ms)")
+    for problem in problems:
+        print(f"    {problem}")
+
+def watch(issues_dir: str, interval: float) -> None:
+    index = CorpusIndex(issues_dir)
+    print(f"Watching {issues_dir} ({len(index.mtimes)} issues, {len(index.connections)} connection sets). Ctrl-C to stop.")
+
+    pending: dict[str, int] = {}  # changed page → mtime seen on the previous poll
+    unreadable: dict[str, str] = {}  # page → last read error, reported once
+    connections_error = ''
+    try:
+        while True:
+            time.sleep(interval)
+            if index.load_connections():
+                print(f"↻ reloaded {CONNECTIONS_FILE} ({len(index.connections)} connection sets)")
+            if index.connections_error and index.connections_error != connections_error:
+                print(f"! {CONNECTIONS_FILE} could not be read ({index.connections_error}); keeping the previous copy")
+            connections_error = index.connections_error
+
+            current = index.scan()
+            removed = [name for name in index.mtimes if name not in current]
+            settled = []
+            for name, mtime in current.items():
+                if index.mtimes.get(name) == mtime:
+                    pending.pop(name, None)
+                elif pending.get(name) == mtime:
+                    settled.append(name)
+                else:
+                    pending[name] = mtime  # still being written, or just saved: look again next poll
+            for name in removed:
+                del index.mtimes[name]
+                pending.pop(name, None)
+                unreadable.pop(name, None)
+
+            for filename in sorted(settled):
+                del pending[filename]
+                previous = index.mtimes.get(filename)
+                index.mtimes[filename] = current[filename]
+                try:
+                    refresh_page(index, filename)
+                    unreadable.pop(filename, None)
+                except (OSError, UnicodeDecodeError) as error:
+                    # Deleted or half-written: forget the new mtime so a later poll tries again
+                    if unreadable.get(filename) != str(error):
+                        print(f"! {filename[:-3]}: could not read ({error}); retrying")
+                    unreadable[filename] = str(error)
+                    if previous is None:
+                        del index.mtimes[filename]
+                    else:
+                        index.mtimes[filename] = previous
+            for filename in sorted(removed):
+                print(f"- {filename[:-3]} removed")
+                for problem in index.validate(filename[:-3]):
+                    print(f"    {problem}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', action='store_true', help='print per-stage timings and slowest files')
+    parser.add_argument('--profile-top', type=int, default=10, help='number of slowest files to list')
+    parser.add_argument('--pstats', metavar='PATH', help='write a cProfile dump (implies --profile)')
+    parser.add_argument('--trace', metavar='PATH', help='write a Chrome trace JSON (implies --profile)')
+    parser.add_argument('--watch', action='store_true', help='retag and revalidate pages as they are saved')
+    parser.add_argument('--interval', type=float, default=0.5, help='watch polling interval in seconds')
+    args = parser.parse_args()
+
     issues_dir = "wiki/issues"
     if not os.path.exists(issues_dir):
         print(f"Error: {issues_dir} not found. Run from shadow-workipedia root.")
         sys.exit(1)
 
+    if args.watch:
+        watch(issues_dir, args.interval)
+        return
+
+    profiling = args.profile or args.pstats or args.trace
+    profiler = StageProfiler(trace=bool(args.trace)) if profiling else NULL_PROFILER
+    if args.pstats:
+        profiler.start_cprofile()
+
     updated = 0
     total = 0
     issues_by_mechanic: dict[str, int] = {}
 
-    for filename in sorted(os.listdir(issues_dir)):
+    with profiler.stage('listdir'):
+        filenames = sorted(os.listdir(issues_dir))
+
+    for filename in filenames:
         if not filename.endswith('.md'):
             continue
 
         filepath = os.path.join(issues_dir, filename)
-        slug, mechanics, was_updated = process_issue(filepath)
+        slug, mechanics, was_updated = process_issue(filepath, profiler)
         total += 1
 
         if was_updated:
@@ -352,5 +593,11 @@ def main():
     for m, count in sorted(issues_by_mechanic.items(), key=lambda x: -x[1])[:15]:
         print(f"  {m}: {count}")
 
+    if args.pstats:
+        profiler.stop_cprofile(args.pstats)
+    profiler.report(top=args.profile_top)
+    if args.trace:
+        profiler.write_trace(args.trace)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmarks for the Python data scripts.
+
+Generates seeded synthetic corpora at multiples of today's size (369 issues,
+297 connection sets, 1,118 principles) and times each stage in a fresh child
+process so peak RSS is per stage:
+
+  tag       apply-mechanics-tags.py process_issue() over every issue page
+  merge     add-infra-tech-connections.py merge_connections() + JSON write
+  validate  frontmatter parse of every issue + validate_connections()
+  index     build-principles-index.py full (cold cache) scan
+
+Usage:
+  python3 scripts/benchmark-scripts.py                       # 1×, 10×, 100×
+  python3 scripts/benchmark-scripts.py --scales 1,10 --repeat 5
+  python3 scripts/benchmark-scripts.py --compare bench-results.json --threshold 0.25
+
+Results go to bench-results.json (see --output). With --compare, exits 1 when
+any stage is slower or uses more memory than the baseline by more than --threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from wiki_corpus import ROOT, load_script, now_iso, parse_frontmatter
+
+BASE_ISSUES = 369
+BASE_CONNECTION_SETS = 297
+BASE_PRINCIPLES = 1118
+STAGES = ["tag", "merge", "validate", "index"]
+RESULTS_FILE = ROOT / "bench-results.json"
+
+FILLER_WORDS = (
+    "policy markets governments households regional pressure capacity systems "
+    "response institutions funding public private sector workers communities "
+    "prices demand supply risk costs data access national global local rising "
+    "falling years decades budget reform coalition enforcement agencies courts"
+).split()
+RELATIONSHIP_TYPES = ["causal", "reinforcing", "thematic", "sequential"]
+
+
+# --- Synthetic corpus ------------------------------------------------------
+
+def paragraph(rng: random.Random, keywords: list[str], words: int) -> str:
+    tokens = [rng.choice(FILLER_WORDS) for _ in range(words)]
+    for _ in range(max(1, words // 60)):
+        tokens.insert(rng.randrange(len(tokens)), rng.choice(keywords))
+    return ' '.join(tokens).capitalize() + '.'
+
+
+def issue_page(rng: random.Random, slug: str, number: int, keywords: list[str], slugs: list[str]) -> str:
+    sections = []
+    for heading in ("Overview", "Game Mechanics", "Current State", "Historical Context", "Intervention Points"):
+        body = '\n\n'.join(paragraph(rng, keywords, rng.randint(120, 260)) for _ in range(2))
+        sections.append(f"## {heading}\n\n{body}")
+    connections = ', '.join(rng.sample(slugs, 3))
+    return (
+        f"---\nid: {slug}\ntitle: {slug.replace('-', ' ').title()}\nnumber: {number}\n"
+        f"category: [Economic, Social]\nurgency: High\ntags: [synthetic, benchmark]\n"
+        f"publicConcern: {rng.randint(40, 95)}\neconomicImpact: {rng.randint(40, 95)}\n"
+        f"socialImpact: {rng.randint(40, 95)}\naffectedSystems: [Economy, Politics]\n"
+        f"connections: [{connections}]\neditedBy: Benchmark\nmechanics: []\n"
+        f"lastUpdated: 2025-01-01\n---\n\n# {slug}\n\n" + '\n\n'.join(sections) + '\n'
+    )
+
+
+def principle_page(rng: random.Random, index: int) -> str:
+    name = f"Synthetic Principle {index}"
+    description = paragraph(rng, [f"{rng.randint(1, 99)}%", f"{rng.randint(2, 9)}×", f"> {rng.random():.2f}"], 120)
+    return (
+        f'---\nname: "{name}"\nid: synthetic-principle-{index}\nsource: {index % 150}-synthetic-ARCHITECTURE.md\n'
+        f'system: "SW#{index % 150}: synthetic"\ncategory: principle\n---\n\n# {name}\n\n{description}\n'
+    )
+
+
+def connection_sets(rng: random.Random, slugs: list[str], count: int) -> list[dict]:
+    sets = []
+    for source in rng.sample(slugs, min(count, len(slugs))):
+        targets = []
+        for target in rng.sample(slugs, 4):
+            if rng.random() < 0.01:
+                target = f"{target}-missing"
+            targets.append({
+                "targetId": target,
+                "targetName": target.replace('-', ' ').title(),
+                "relationshipType": rng.choice(RELATIONSHIP_TYPES),
+                "reasoning": paragraph(rng, FILLER_WORDS, 14),
+            })
+        sets.append({"issueId": source, "issueName": source.replace('-', ' ').title(), "connectedTo": targets})
+    return sets
+
+
+def generate_issues(corpus: Path, scale: int, seed: int) -> None:
+    rng = random.Random(f"{seed}:{scale}:issues")
+    tagger = load_script('apply-mechanics-tags')
+    keywords = [kw for patterns in tagger.MECHANICS_PATTERNS.values() for kw in patterns]
+    issues_dir = corpus / "issues"
+    shutil.rmtree(issues_dir, ignore_errors=True)
+    issues_dir.mkdir(parents=True)
+    slugs = [f"synthetic-issue-{i:06d}" for i in range(BASE_ISSUES * scale)]
+    for number, slug in enumerate(slugs, 1):
+        (issues_dir / f"{slug}.md").write_text(issue_page(rng, slug, number, keywords, slugs), encoding='utf-8')
+
+
+def generate_corpus(corpus: Path, scale: int, seed: int) -> None:
+    rng = random.Random(f"{seed}:{scale}")
+    generate_issues(corpus, scale, seed)
+
+    slugs = [f"synthetic-issue-{i:06d}" for i in range(BASE_ISSUES * scale)]
+    existing = connection_sets(rng, slugs, BASE_CONNECTION_SETS * scale)
+    additions = connection_sets(rng, slugs, max(1, BASE_CONNECTION_SETS * scale // 10))
+    connections = {"metadata": {"totalConnections": 0}, "connections": existing}
+    (corpus / "connections.json").write_text(json.dumps(connections, indent=2), encoding='utf-8')
+    (corpus / "additions.json").write_text(json.dumps(additions), encoding='utf-8')
+
+    principles_dir = corpus / "principles"
+    principles_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(BASE_PRINCIPLES * scale):
+        (principles_dir / f"synthetic-principle-{i}.md").write_text(principle_page(rng, i), encoding='utf-8')
+
+
+# --- Stages (run inside the child process) ---------------------------------
+
+def stage_tag(corpus: Path) -> tuple[str, int]:
+    tagger = load_script('apply-mechanics-tags')
+    issues_dir = corpus / "issues"
+    count = 0
+    for filename in sorted(os.listdir(issues_dir)):
+        if filename.endswith('.md'):
+            tagger.process_issue(str(issues_dir / filename))
+            count += 1
+    return "files", count
+
+
+def stage_merge(corpus: Path) -> tuple[str, int]:
+    merger = load_script('add-infra-tech-connections')
+    connections = json.loads((corpus / "connections.json").read_text(encoding='utf-8'))
+    additions = json.loads((corpus / "additions.json").read_text(encoding='utf-8'))
+    merger.merge_connections(connections, additions)
+    (corpus / "connections.merged.json").write_text(json.dumps(connections, indent=2), encoding='utf-8')
+    return "connectionSets", len(connections['connections'])
+
+
+def stage_validate(corpus: Path) -> tuple[str, int]:
+    merger = load_script('add-infra-tech-connections')
+    issue_ids: set[str] = set()
+    count = 0
+    for path in sorted((corpus / "issues").glob('*.md')):
+        frontmatter, _ = parse_frontmatter(path.read_text(encoding='utf-8'))
+        issue_ids.add(str(frontmatter.get('id', path.stem)))
+        count += 1
+    connections = json.loads((corpus / "connections.json").read_text(encoding='utf-8'))
+    merger.validate_connections(connections, issue_ids)
+    return "files", count
+
+
+def stage_index(corpus: Path) -> tuple[str, int]:
+    builder = load_script('build-principles-index')
+    builder.PRINCIPLES_DIR = corpus / "principles"
+    files, _, _, _ = builder.scan({})
+    return "files", len(files)
+
+
+STAGE_FUNCTIONS = {
+    "tag": stage_tag,
+    "merge": stage_merge,
+    "validate": stage_validate,
+    "index": stage_index,
+}
+
+
+def run_stage_in_child(stage: str, corpus: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--run-stage", stage, "--corpus", str(corpus)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def peak_rss_kb() -> int:
+    """
+    High-water RSS of this process. /proc VmHWM is reset on exec, unlike
+    ru_maxrss which Linux carries over from the (much larger) parent.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child_main(stage: str, corpus: Path) -> None:
+    # Silence the scripts' own progress output so stdout stays machine-readable
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    start = time.perf_counter()
+    unit, items = STAGE_FUNCTIONS[stage](corpus)
+    seconds = time.perf_counter() - start
+    sys.stdout = real_stdout
+    print(json.dumps({"unit": unit, "items": items, "seconds": seconds, "peakRssKb": peak_rss_kb()}))
+
+
+# --- Driver ----------------------------------------------------------------
+
+def benchmark(scales: list[int], stages: list[str], repeat: int, seed: int, workdir: Path) -> list[dict]:
+    results = []
+    for scale in scales:
+        corpus = workdir / f"scale-{scale}"
+        print(f"Generating {scale}× corpus in {corpus} ...")
+        generate_corpus(corpus, scale, seed)
+
+        for stage in stages:
+            runs = []
+            for _ in range(repeat):
+                if stage == "tag":
+                    generate_issues(corpus, scale, seed)
+                runs.append(run_stage_in_child(stage, corpus))
+            seconds = statistics.median(run['seconds'] for run in runs)
+            items = runs[0]['items']
+            entry = {
+                "scale": scale,
+                "stage": stage,
+                "unit": runs[0]['unit'],
+                "items": items,
+                "seconds": round(seconds, 6),
+                "runs": [round(run['seconds'], 6) for run in runs],
+                "itemsPerSecond": round(items / seconds, 1) if seconds else None,
+                "peakRssKb": max(run['peakRssKb'] for run in runs),
+            }
+            results.append(entry)
+            print(f"  {scale:>4}× {stage:<9} {seconds:8.3f}s  {entry['itemsPerSecond']:>12,.0f} {entry['unit']}/s"
+                  f"  {entry['peakRssKb'] / 1024:7.1f} MB")
+    return results
+
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    previous = {(r['scale'], r['stage']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        old = previous.get((result['scale'], result['stage']))
+        if not old:
+            continue
+        for metric in ("seconds", "peakRssKb"):
+            if old[metric] and result[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    f"{result['scale']}× {result['stage']}: {metric} {old[metric]} → {result[metric]} "
+                    f"(+{(result[metric] / old[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def parse_list(raw: str) -> list[str]:
+    return [part.strip() for part in raw.split(',') if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='1,10,100', help='comma-separated corpus multipliers')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f'comma-separated subset of {STAGES}')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per stage; the median is reported')
+    parser.add_argument('--seed', type=int, default=1, help='seed for corpus generation')
+    parser.add_argument('--workdir', help='where to generate corpora (default: a temp dir, removed afterwards)')
+    parser.add_argument('--output', default=str(RESULTS_FILE), help='results JSON path')
+    parser.add_argument('--compare', help='baseline results JSON for regression checking')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown/growth ratio for --compare')
+    parser.add_argument('--run-stage', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--corpus', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        child_main(args.run_stage, Path(args.corpus))
+        return
+
+    scales = [int(s) for s in parse_list(args.scales)]
+    stages = parse_list(args.stages)
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        print(f"Error: unknown stage(s): {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix='workipedia-bench-'))
+    try:
+        results = benchmark(scales, stages, args.repeat, args.seed, workdir)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "generatedAt": now_iso(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "seed": args.seed,
+        "baseSizes": {"issues": BASE_ISSUES, "connectionSets": BASE_CONNECTION_SETS, "principles": BASE_PRINCIPLES},
+        "results": results,
+    }
+
+    # Compare before writing so --compare and --output may point at the same file
+    regressions = compare(results, Path(args.compare), args.threshold) if args.compare else []
+
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\n✓ Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"✓ No regressions over {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
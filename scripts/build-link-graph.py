@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Build the wiki cross-link graph and report broken or ambiguous links.
+
+Every page under wiki/ is read once, line by line, collecting three kinds
+of link:
+
+  link        markdown links to #/wiki/<slug> or /wiki/<slug>, and [[slug|label]]
+  connection  slugs in the `connections:` frontmatter list
+  cascade     **Bold Names** inside a "Cascading Effects" section
+
+Targets resolve against a slug index of the article pages (issues,
+systems, principles, primitives, mechanics; a slug is the frontmatter id,
+as in parse-wiki.ts). Pages with `mergedInto` redirect to their target,
+and so do the alias and merged ids in public/data.json's issueIdRedirects
+when that file has been built (`pnpm extract-data`).
+A broken link records why: `missing`, `archived` (the page only exists in
+wiki/issues/archive) or `community` (community pages are routed at
+#/communities/<slug>, not #/wiki/<slug>).
+Bold cascade names resolve by slug or by title. Most of them are prose
+labels rather than page names, so an unmatched name is counted, not
+reported as broken.
+
+Writes data/wiki-link-graph.json with the edge list ([source, target, kind]),
+plus the broken, ambiguous and redirected links with file and line.
+
+Run from anywhere: python3 scripts/build-link-graph.py [--check] [--output path]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import Counter, defaultdict
+
+from wiki_corpus import (
+    ROOT, WIKI_DIR, as_list, load_issue_redirects, now_iso, parse_frontmatter, resolve_issue_id, write_artifact,
+)
+
+ARTICLE_DIRS = ['issues', 'systems', 'principles', 'primitives', 'mechanics']
+SOURCE_DIRS = ARTICLE_DIRS + ['communities']
+ARCHIVE_DIR = WIKI_DIR / "issues" / "archive"
+OUTPUT_FILE = ROOT / "data" / "wiki-link-graph.json"
+
+LINK_PATTERN = re.compile(r'\]\((?:#)?/wiki/([^)\s#?]+)\)|\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
+BOLD_PATTERN = re.compile(r'\*\*([^*]+?)\*\*')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+CASCADE_HEADING = re.compile(r'cascading effects', re.IGNORECASE)
+
+
+def name_key(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.casefold()).strip('-')
+
+
+class SlugIndex:
+    def __init__(self, redirects: dict[str, str] | None = None):
+        self.redirects = redirects or {}  # issueIdRedirects: alias or merged id → canonical id
+        self.pages: dict[str, list[str]] = defaultdict(list)  # slug → relative paths
+        self.titles: dict[str, set[str]] = defaultdict(set)  # name_key(title) → slugs
+        self.merged: dict[str, str] = {}
+        self.elsewhere: dict[str, str] = {}  # unroutable slug → why (archived, community)
+
+    def add(self, slug: str, path: str, frontmatter: dict) -> None:
+        self.pages[slug].append(path)
+        title = frontmatter.get('title') or frontmatter.get('name')
+        if title:
+            self.titles[name_key(str(title))].add(slug)
+        merged_into = str(frontmatter.get('mergedInto') or '').strip()
+        if merged_into:
+            self.merged[slug] = merged_into
+
+    def page_slug(self, slug: str) -> str:
+        """The slug itself if it has a page, else where issueIdRedirects sends it."""
+        return slug if slug in self.pages else resolve_issue_id(slug, self.redirects)
+
+    def resolve(self, slug: str) -> tuple[str, str | None, str | None]:
+        """(status, resolved slug, redirected-from) for a slug link."""
+        target = self.page_slug(slug)
+        if target not in self.pages:
+            return 'broken', None, None
+        if len(self.pages[target]) > 1:
+            return 'ambiguous', None, None
+        seen = {slug, target}
+        while target in self.merged and self.merged[target] in self.pages and self.merged[target] not in seen:
+            target = self.merged[target]
+            seen.add(target)
+        return 'ok', target, slug if target != slug else None
+
+    def resolve_name(self, name: str) -> tuple[str, set[str]]:
+        key = name_key(name)
+        candidates = set(self.titles.get(key, ()))
+        if key in self.pages:
+            candidates.add(key)
+        if not candidates:
+            return 'unmatched', candidates
+        return ('ok' if len(candidates) == 1 else 'ambiguous'), candidates
+
+
+def load_pages() -> list[tuple[str, str, dict, str, int, int]]:
+    """
+    (slug, relative path, frontmatter, body, body start line, connections line)
+    for every source page.
+    """
+    pages = []
+    for directory in SOURCE_DIRS:
+        for path in sorted((WIKI_DIR / directory).glob('*.md')):
+            if path.name.startswith('_'):
+                continue
+            content = path.read_text(encoding='utf-8')
+            frontmatter, body = parse_frontmatter(content)
+            header = content[:len(content) - len(body)] if body else content
+            connections_at = header.find('\nconnections:')
+            connections_line = header.count('\n', 0, connections_at) + 2 if connections_at >= 0 else 1
+            slug = str(frontmatter.get('id', path.stem))
+            pages.append((slug, path.relative_to(ROOT).as_posix(), frontmatter,
+                          body, header.count('\n') + 1, connections_line))
+    return pages
+
+
+def extract(body: str, first_line: int):
+    """Yield (kind, target, line) for every link in one page body, in one pass."""
+    in_fence = False
+    cascade_level = 0
+    for number, line in enumerate(body.split('\n'), start=first_line):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            level = len(heading.group(1))
+            if CASCADE_HEADING.search(heading.group(2)):
+                cascade_level = level
+            elif cascade_level and level <= cascade_level:
+                cascade_level = 0
+            continue
+
+        for match in LINK_PATTERN.finditer(line):
+            yield 'link', (match.group(1) or match.group(2)).strip(), number
+        if cascade_level:
+            for match in BOLD_PATTERN.finditer(line):
+                yield 'cascade', match.group(1).strip().rstrip(':').strip(), number
+
+
+def build(pages, redirects: dict[str, str] | None = None) -> dict:
+    index = SlugIndex(redirects)
+    for slug, path, frontmatter, *_ in pages:
+        if path.startswith('wiki/communities/'):
+            index.elsewhere[slug] = 'community'
+        else:
+            index.add(slug, path, frontmatter)
+    for path in ARCHIVE_DIR.glob('*.md'):
+        index.elsewhere.setdefault(path.stem, 'archived')
+
+    edges: set[tuple[str, str, str]] = set()
+    broken, ambiguous, redirects = [], [], []
+    unmatched_names: Counter = Counter()
+    counts: Counter = Counter()
+
+    def record(kind, source, path, line, status, target, raw, detail=None):
+        counts[f"{kind}:{status}"] += 1
+        entry = {'source': source, 'file': path, 'line': line, 'kind': kind, 'target': raw}
+        if status == 'broken':
+            broken.append({**entry, 'reason': index.elsewhere.get(raw, 'missing')})
+        elif status == 'ambiguous':
+            ambiguous.append({**entry, 'candidates': detail})
+        elif target != source:
+            edges.add((source, target, kind))
+
+    for source, path, frontmatter, body, first_line, connections_line in pages:
+        for target in as_list(frontmatter.get('connections')):
+            raw = str(target).strip()
+            status, resolved, redirected = index.resolve(raw)
+            record('connection', source, path, connections_line, status, resolved, raw,
+                   index.pages.get(index.page_slug(raw)))
+            if redirected:
+                redirects.append({'source': source, 'file': path, 'line': connections_line,
+                                  'from': redirected, 'to': resolved})
+
+        for kind, raw, line in extract(body, first_line):
+            if kind == 'link':
+                status, resolved, redirected = index.resolve(raw)
+                record(kind, source, path, line, status, resolved, raw,
+                       index.pages.get(index.page_slug(raw)))
+                if redirected:
+                    redirects.append({'source': source, 'file': path, 'line': line, 'from': redirected, 'to': resolved})
+                continue
+
+            status, candidates = index.resolve_name(raw)
+            if status == 'unmatched':
+                counts['cascade:unmatched'] += 1
+                unmatched_names[raw] += 1
+                continue
+            if status == 'ambiguous':
+                record(kind, source, path, line, status, None, raw, sorted(candidates))
+                continue
+            _, resolved, _ = index.resolve(next(iter(candidates)))
+            record(kind, source, path, line, 'ok' if resolved else 'ambiguous', resolved, raw,
+                   index.pages.get(next(iter(candidates))))
+
+    return {
+        'generatedAt': now_iso(),
+        'pages': len(pages),
+        'kinds': ['link', 'connection', 'cascade'],
+        'edges': [list(edge) for edge in sorted(edges)],
+        'broken': broken,
+        'ambiguous': ambiguous,
+        'redirects': redirects,
+        'duplicateSlugs': {slug: paths for slug, paths in sorted(index.pages.items()) if len(paths) > 1},
+        'stats': {
+            **dict(sorted(counts.items())),
+            'edges': len(edges),
+            'unmatchedCascadeNames': len(unmatched_names),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=str(OUTPUT_FILE), help='artifact path')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any link is broken or ambiguous')
+    parser.add_argument('--top', type=int, default=15, help='broken targets listed in the summary')
+    args = parser.parse_args()
+
+    if not WIKI_DIR.exists():
+        print(f"Error: {WIKI_DIR} not found.")
+        sys.exit(1)
+
+    redirects = load_issue_redirects()
+    if redirects is None:
+        print("⚠ public/data.json not found (run pnpm extract-data); issue aliases are reported as broken")
+    graph = build(load_pages(), redirects)
+    write_artifact(args.output, graph, separators=(',', ':'))
+
+    stats = graph['stats']
+    print(f"✓ {graph['pages']} pages → {stats['edges']} edges")
+    for kind in graph['kinds']:
+        ok = stats.get(f"{kind}:ok", 0)
+        print(f"  {kind:<11} {ok:6d} resolved  {stats.get(f'{kind}:broken', 0):5d} broken  "
+              f"{stats.get(f'{kind}:ambiguous', 0):5d} ambiguous")
+    print(f"  {len(graph['redirects'])} links follow a mergedInto or issue-id redirect; "
+          f"{stats.get('cascade:unmatched', 0)} bold cascade names are prose, not page names")
+
+    if graph['broken']:
+        reasons = Counter(b['reason'] for b in graph['broken'])
+        print(f"\n✗ {len(graph['broken'])} broken: " + ', '.join(f"{n} {r}" for r, n in reasons.most_common()))
+        missing = Counter(b['target'] for b in graph['broken'] if b['reason'] == 'missing')
+        for target, count in missing.most_common(args.top):
+            print(f"  {count:5d}  {target}")
+    for slug, paths in graph['duplicateSlugs'].items():
+        print(f"✗ Slug {slug} is used by {', '.join(paths)}")
+    print(f"\n✓ Wrote {args.output}")
+
+    if args.check and (graph['broken'] or graph['ambiguous']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Incrementally rebuild data/principles-index.json from wiki/principles/*.md.
+
+Keeps a per-file hash cache so only added, changed or deleted principle pages
+are re-parsed; the existing index is patched in place (order preserved) and
+`count` / `generatedAt` are recomputed.
+
+Run from anywhere: python3 scripts/build-principles-index.py [--full]
+"""
+import argparse
+import bisect
+import json
+import re
+import sys
+import time
+
+from wiki_corpus import ROOT, WIKI_DIR, content_hash, now_iso, parse_frontmatter, write_artifact
+
+PRINCIPLES_DIR = WIKI_DIR / "principles"
+INDEX_FILE = ROOT / "data" / "principles-index.json"
+CACHE_FILE = ROOT / "data" / ".principles-index.cache.json"
+CACHE_VERSION = 1
+
+# Same pattern as THRESHOLD_PATTERN in scripts/extract-principles.ts
+THRESHOLD_PATTERN = re.compile(
+    r'(?:>|<|>=|<=|=)\s*[\d.]+%?|[\d.]+[×x]\s*|[\d.]+%|[\d,]+\s*(?:ton|kg|km|GW|MW|year|month|week|day|hour)',
+    re.IGNORECASE,
+)
+
+
+def sort_key(entry: dict) -> str:
+    return entry['name'].casefold()
+
+
+def extract_description(body: str) -> str:
+    """The description is the paragraph between the H1 title and the first H2 section."""
+    text = re.sub(r'\A\s*# [^\n]*\n', '', body, count=1)
+    return text.split('\n## ', 1)[0].strip()
+
+
+def parse_principle(data: bytes) -> dict | None:
+    """Build an index entry from a principle page, or None if it isn't one."""
+    frontmatter, body = parse_frontmatter(data.decode('utf-8'))
+    if frontmatter.get('category') != 'principle' or not frontmatter.get('id'):
+        return None
+
+    thresholds = set(THRESHOLD_PATTERN.findall(extract_description(body)))
+    return {
+        'id': str(frontmatter['id']),
+        'name': str(frontmatter.get('name', frontmatter['id'])),
+        'system': str(frontmatter.get('system', '')),
+        'sourceFile': str(frontmatter.get('source', '')),
+        'thresholdCount': len(thresholds),
+    }
+
+
+def load_cache() -> dict:
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(files: dict) -> None:
+    CACHE_FILE.write_text(json.dumps({'version': CACHE_VERSION, 'files': files}), encoding='utf-8')
+
+
+def scan(cached: dict) -> tuple[dict, dict, dict, list[str]]:
+    """
+    Compare wiki/principles against the cache.
+    Returns (new cache, changed entries by file, removed entries by file, unchanged-but-touched files).
+    """
+    files: dict = {}
+    changed: dict = {}
+    touched: list[str] = []
+
+    for path in sorted(PRINCIPLES_DIR.glob('*.md')):
+        stat = path.stat()
+        prev = cached.get(path.name)
+        if prev and prev['mtime'] == stat.st_mtime_ns and prev['size'] == stat.st_size:
+            files[path.name] = prev
+            continue
+
+        data = path.read_bytes()
+        digest = content_hash(data)
+        if prev and prev['hash'] == digest:
+            files[path.name] = {**prev, 'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+            touched.append(path.name)
+            continue
+
+        entry = parse_principle(data)
+        files[path.name] = {'hash': digest, 'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'entry': entry}
+        changed[path.name] = entry
+
+    removed = {name: info.get('entry') for name, info in cached.items() if name not in files}
+    return files, changed, removed, touched
+
+
+def patch_index(principles: list[dict], changed: dict, removed: dict, previous: dict) -> list[dict]:
+    """Apply changed/removed entries to the index list, keeping existing order stable."""
+    drop_ids = {entry['id'] for entry in removed.values() if entry}
+    drop_ids.update(
+        previous[name]['entry']['id']
+        for name in changed
+        if name in previous and previous[name].get('entry')
+    )
+    updates = {entry['id']: entry for entry in changed.values() if entry}
+
+    patched: list[dict] = []
+    for entry in principles:
+        if entry['id'] in updates:
+            new_entry = updates.pop(entry['id'])
+            if sort_key(new_entry) == sort_key(entry):
+                patched.append(new_entry)
+            else:
+                updates[new_entry['id']] = new_entry
+        elif entry['id'] not in drop_ids:
+            patched.append(entry)
+
+    keys = [sort_key(entry) for entry in patched]
+    for entry in sorted(updates.values(), key=sort_key):
+        pos = bisect.bisect_right(keys, sort_key(entry))
+        keys.insert(pos, sort_key(entry))
+        patched.insert(pos, entry)
+
+    return patched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--full', action='store_true', help='ignore the cache and re-parse every page')
+    args = parser.parse_args()
+
+    if not PRINCIPLES_DIR.exists():
+        print(f"Error: {PRINCIPLES_DIR} not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index_exists = INDEX_FILE.exists()
+    cached = {} if args.full or not index_exists else load_cache()
+
+    files, changed, removed, touched = scan(cached)
+
+    if not cached:
+        # No usable cache: rebuild the index from scratch
+        entries = sorted((e for e in changed.values() if e), key=sort_key)
+    elif not changed and not removed:
+        if touched:
+            save_cache(files)
+        print(f"✓ principles-index.json up to date ({len(files)} pages, {time.perf_counter() - start:.3f}s)")
+        return
+    else:
+        index = json.loads(INDEX_FILE.read_text(encoding='utf-8'))
+        entries = patch_index(index.get('principles', []), changed, removed, cached)
+
+    index = {
+        'generatedAt': now_iso(),
+        'count': len(entries),
+        'principles': entries,
+    }
+    write_artifact(INDEX_FILE, index, indent=2)
+    save_cache(files)
+
+    print(f"✓ Re-parsed {len(changed)} page(s), removed {len(removed)}")
+    print(f"✓ principles-index.json: {len(entries)} principles ({time.perf_counter() - start:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
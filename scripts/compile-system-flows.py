@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Compile data/system-data-flows.json into a precomputed update-order artifact.
+
+Interns SW# system codes to integer ids, builds writer/reader adjacency,
+condenses feedback cycles into strongly connected components and emits a
+topological update order (with parallel levels) plus fan-in/fan-out hot spots.
+
+Run from anywhere: python3 scripts/compile-system-flows.py
+Output: data/system-flow-graph.json (compact JSON)
+"""
+import argparse
+import heapq
+import json
+import re
+import sys
+
+from wiki_corpus import ROOT, now_iso, write_artifact
+
+FLOWS_FILE = ROOT / "data" / "system-data-flows.json"
+OUTPUT_FILE = ROOT / "data" / "system-flow-graph.json"
+
+SYSTEM_CODE_PATTERN = re.compile(r'^SW#0*(\d+)([a-z]?)$', re.IGNORECASE)
+
+
+def normalize_code(code: str) -> str:
+    """SW#4 and SW#04 are the same system; canonical form is zero-padded to two digits."""
+    match = SYSTEM_CODE_PATTERN.match(code.strip())
+    if not match:
+        return code.strip()
+    return f"SW#{int(match.group(1)):02d}{match.group(2).lower()}"
+
+
+def code_sort_key(code: str) -> tuple:
+    match = SYSTEM_CODE_PATTERN.match(code)
+    if not match:
+        return (sys.maxsize, code)
+    return (int(match.group(1)), match.group(2))
+
+
+def intern_systems(flows: list[dict]) -> tuple[list[str], dict[str, int]]:
+    codes = {normalize_code(f[key]) for f in flows for key in ('source', 'target')}
+    systems = sorted(codes, key=code_sort_key)
+    return systems, {code: i for i, code in enumerate(systems)}
+
+
+def strongly_connected_components(n: int, readers: list[list[int]]) -> list[list[int]]:
+    """Iterative Tarjan. Components come out in reverse topological order."""
+    index_of = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index_of[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge_pos = work.pop()
+            if edge_pos == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            recurse = False
+            edges = readers[node]
+            while edge_pos < len(edges):
+                nxt = edges[edge_pos]
+                edge_pos += 1
+                if index_of[nxt] == -1:
+                    work.append((node, edge_pos))
+                    work.append((nxt, 0))
+                    recurse = True
+                    break
+                if on_stack[nxt]:
+                    lowlink[node] = min(lowlink[node], index_of[nxt])
+            if recurse:
+                continue
+
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
+def condensed_order(components: list[list[int]], readers: list[list[int]], n: int) -> tuple[list[int], list[int]]:
+    """
+    Kahn's algorithm over the SCC condensation, lowest system id first.
+    Returns (component order, level per component) where a level is the
+    longest upstream chain, i.e. components on the same level can tick in parallel.
+    """
+    component_of = [0] * n
+    for cid, members in enumerate(components):
+        for node in members:
+            component_of[node] = cid
+
+    downstream: list[set[int]] = [set() for _ in components]
+    indegree = [0] * len(components)
+    for node in range(n):
+        for nxt in readers[node]:
+            a, b = component_of[node], component_of[nxt]
+            if a != b and b not in downstream[a]:
+                downstream[a].add(b)
+                indegree[b] += 1
+
+    level = [0] * len(components)
+    ready = [(components[cid][0], cid) for cid in range(len(components)) if indegree[cid] == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        _, cid = heapq.heappop(ready)
+        order.append(cid)
+        for nxt in downstream[cid]:
+            level[nxt] = max(level[nxt], level[cid] + 1)
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                heapq.heappush(ready, (components[nxt][0], nxt))
+
+    return order, level
+
+
+def hot_spots(systems: list[str], degree: list[int], top: int) -> list[dict]:
+    ranked = sorted(range(len(systems)), key=lambda i: (-degree[i], i))
+    return [{'id': i, 'system': systems[i], 'degree': degree[i]} for i in ranked[:top] if degree[i] > 0]
+
+
+def compile_flows(flows_data: dict, top: int) -> dict:
+    flows = flows_data.get('flows', [])
+    systems, ids = intern_systems(flows)
+    n = len(systems)
+
+    edges: set[tuple[int, int]] = set()
+    self_loops: set[int] = set()
+    payload: dict[tuple[int, int], set[str]] = {}
+    for flow in flows:
+        source, target = ids[normalize_code(flow['source'])], ids[normalize_code(flow['target'])]
+        if source == target:
+            self_loops.add(source)
+            continue
+        edges.add((source, target))
+        if flow.get('data'):
+            payload.setdefault((source, target), set()).update(flow['data'])
+
+    # readers[i]: systems that read what i writes; writers[i]: systems i reads from
+    readers: list[list[int]] = [[] for _ in range(n)]
+    writers: list[list[int]] = [[] for _ in range(n)]
+    for source, target in sorted(edges):
+        readers[source].append(target)
+        writers[target].append(source)
+
+    components = strongly_connected_components(n, readers)
+    order, level = condensed_order(components, readers, n)
+
+    ordered_components = [components[cid] for cid in order]
+    update_order = [node for members in ordered_components for node in members]
+    levels: list[list[int]] = []
+    for cid in order:
+        while len(levels) <= level[cid]:
+            levels.append([])
+        levels[level[cid]].extend(components[cid])
+
+    fan_in = [len(w) for w in writers]
+    fan_out = [len(r) for r in readers]
+
+    return {
+        'generatedAt': now_iso(),
+        'sourceGeneratedAt': flows_data.get('generatedAt'),
+        'systems': systems,
+        'edges': [list(edge) for edge in sorted(edges)],
+        'edgeData': [[s, t, sorted(d)] for (s, t), d in sorted(payload.items())],
+        'writers': writers,
+        'readers': readers,
+        'selfLoops': sorted(self_loops),
+        'updateOrder': update_order,
+        'cycles': [members for members in ordered_components if len(members) > 1],
+        'levels': [sorted(nodes) for nodes in levels],
+        'hotSpots': {
+            'fanIn': hot_spots(systems, fan_in, top),
+            'fanOut': hot_spots(systems, fan_out, top),
+        },
+        'stats': {
+            'systems': n,
+            'rawFlows': len(flows),
+            'edges': len(edges),
+            'components': len(components),
+            'cyclicComponents': sum(1 for members in components if len(members) > 1),
+            'levels': len(levels),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--top', type=int, default=10, help='number of fan-in/fan-out hot spots to keep')
+    parser.add_argument('--output', default=str(OUTPUT_FILE), help='artifact path')
+    args = parser.parse_args()
+
+    if not FLOWS_FILE.exists():
+        print(f"Error: {FLOWS_FILE} not found. Run extract-principles first.")
+        sys.exit(1)
+
+    flows_data = json.loads(FLOWS_FILE.read_text(encoding='utf-8'))
+    compiled = compile_flows(flows_data, args.top)
+
+    write_artifact(args.output, compiled, separators=(',', ':'))
+
+    stats = compiled['stats']
+    print(f"✓ {stats['rawFlows']} flows → {stats['edges']} edges across {stats['systems']} systems")
+    print(f"✓ {stats['components']} components ({stats['cyclicComponents']} cyclic), {stats['levels']} update levels")
+    for spot in compiled['hotSpots']['fanIn'][:3]:
+        print(f"  fan-in  {spot['system']}: {spot['degree']}")
+    for spot in compiled['hotSpots']['fanOut'][:3]:
+        print(f"  fan-out {spot['system']}: {spot['degree']}")
+
+
+if __name__ == "__main__":
+    main()
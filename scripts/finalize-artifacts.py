@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Finalize the JSON artifacts of a built site for deployment.
+
+Runs after `vite build` over every JSON file in dist/ (everything copied
+from public/):
+
+  - re-serializes it minified, in place, so existing fetch() URLs keep working
+  - writes a content-hashed copy next to it (agent-vocab.v1.3f9c2a71be.json)
+  - writes .gz (level 9) and .br (quality 11) siblings for both, for hosts
+    that serve precompressed files
+  - records everything in dist/artifacts-manifest.json
+
+Hashed names never change content, so vercel.json marks them immutable.
+The client looks its artifacts up in the manifest (src/main/artifacts.ts)
+and fetches the hashed copy, falling back to the plain name; the plain
+names stay in place for anything else that fetches them.
+Brotli uses the `brotli` module when installed and otherwise Node's zlib
+(Node is already required for the build); with neither, .br files are
+skipped.
+
+Run from anywhere: python3 scripts/finalize-artifacts.py [--dist dist]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from wiki_corpus import ROOT, now_iso
+
+DIST_DIR = ROOT / "dist"
+MANIFEST_NAME = "artifacts-manifest.json"
+HASH_LENGTH = 10
+HASHED_PATTERN = re.compile(rf'\.[0-9a-f]{{{HASH_LENGTH}}}\.json$')
+
+# Compresses every path given on the command line to <path>.br in one process
+NODE_BROTLI = (
+    "const z=require('zlib'),fs=require('fs');"
+    "const params={[z.constants.BROTLI_PARAM_QUALITY]:11,[z.constants.BROTLI_PARAM_MODE]:z.constants.BROTLI_MODE_TEXT};"
+    "for(const p of process.argv.slice(1))fs.writeFileSync(p+'.br',z.brotliCompressSync(fs.readFileSync(p),{params}));"
+)
+
+
+def brotli_all(paths: list[Path]) -> str | None:
+    """Write a .br sibling for each path; returns the implementation used, or None."""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    if brotli is not None:
+        for path in paths:
+            path.with_name(path.name + '.br').write_bytes(
+                brotli.compress(path.read_bytes(), quality=11, mode=brotli.MODE_TEXT))
+        return 'brotli module'
+    node = shutil.which('node')
+    if node:
+        subprocess.run([node, '-e', NODE_BROTLI, *map(str, paths)], check=True)
+        return 'node zlib'
+    return None
+
+
+def minify(data: bytes) -> bytes:
+    return json.dumps(json.loads(data), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def artifacts(dist: Path) -> list[Path]:
+    return sorted(
+        path for path in dist.rglob('*.json')
+        if path.name != MANIFEST_NAME and not HASHED_PATTERN.search(path.name)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dist', default=str(DIST_DIR), help='build output directory')
+    args = parser.parse_args()
+
+    dist = Path(args.dist).resolve()
+    if not dist.is_dir():
+        print(f"Error: {dist} not found. Run `pnpm build` first.")
+        sys.exit(1)
+
+    # Drop outputs of a previous run so stale hashes don't accumulate
+    for path in dist.rglob('*'):
+        if path.is_file() and (HASHED_PATTERN.search(path.name.removesuffix('.gz').removesuffix('.br'))
+                               or path.name.endswith(('.json.gz', '.json.br'))):
+            path.unlink()
+
+    manifest = {'generatedAt': now_iso(), 'files': {}}
+    written: list[Path] = []
+    for path in artifacts(dist):
+        original = path.read_bytes()
+        data = minify(original)
+        digest = hashlib.sha256(data).hexdigest()
+        hashed = path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}.json")
+        gz = gzip.compress(data, compresslevel=9, mtime=0)
+        for target in (path, hashed):
+            target.write_bytes(data)
+            target.with_name(target.name + '.gz').write_bytes(gz)
+            written.append(target)
+
+        manifest['files'][path.relative_to(dist).as_posix()] = {
+            'file': hashed.relative_to(dist).as_posix(),
+            'sha256': digest,
+            'originalBytes': len(original),
+            'bytes': len(data),
+            'gzip': len(gz),
+        }
+
+    compressor = brotli_all(written)
+    if compressor is None:
+        print("! No brotli module or node found; skipping .br files")
+    else:
+        for name, entry in manifest['files'].items():
+            entry['brotli'] = (dist / (name + '.br')).stat().st_size
+
+    (dist / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+
+    entries = manifest['files'].values()
+    print(f"✓ Finalized {len(entries)} JSON artifacts in {dist.name}/")
+    print(f"  original {sum(e['originalBytes'] for e in entries):>10,} bytes")
+    print(f"  minified {sum(e['bytes'] for e in entries):>10,} bytes")
+    print(f"  gzip -9  {sum(e['gzip'] for e in entries):>10,} bytes")
+    if compressor:
+        print(f"  brotli   {sum(e['brotli'] for e in entries):>10,} bytes ({compressor})")
+    print(f"✓ Wrote {MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    main()
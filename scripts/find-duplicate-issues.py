@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate issue pages with MinHash + locality-sensitive hashing.
+
+Each page (wiki/issues and wiki/issues/archive) becomes a set of
+--shingle-word shingles: runs of consecutive content words from its title,
+tags and body. Single words only say two pages share a topic (China and
+Japan demographic collapse share most of their vocabulary); shared runs of
+words mean shared text. Shingles used by more than --max-df of all pages
+are template phrases and are dropped.
+
+Each page gets a 128-value MinHash signature from one-permutation hashing:
+every shingle hash (XORed with a seeded mask) lands in one of 128 bins by
+its low bits and each bin keeps its minimum, so the signature costs one
+pass over the shingles rather than one per value. Empty bins borrow the
+next filled bin's minimum, tagged with the distance (rotation
+densification), which keeps the collision probability at the Jaccard
+similarity. The signature is split into LSH bands, so only pages sharing
+a band bucket are compared. Bands are sized so that a pair
+sitting exactly at the threshold still becomes a candidate with probability
+--recall: 1 - (1 - t^rows)^bands. Candidates whose exact Jaccard similarity
+reaches --threshold are grouped into clusters.
+
+Run from anywhere: python3 scripts/find-duplicate-issues.py [--threshold 0.5] [--output report.json]
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+from collections import Counter, defaultdict
+
+from wiki_corpus import WIKI_DIR, as_list, content_words, now_iso, parse_frontmatter
+
+ISSUES_DIR = WIKI_DIR / "issues"
+ARCHIVE_DIR = ISSUES_DIR / "archive"
+
+
+def page_words(title: str, tags: list, body: str) -> list[str]:
+    return content_words(' '.join([title, ' '.join(str(t) for t in tags), body]))
+
+
+def shingles(words: list[str], size: int) -> set[str]:
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def load_pages(shingle_size: int) -> dict[str, dict]:
+    pages: dict[str, dict] = {}
+    for directory, archived in ((ISSUES_DIR, False), (ARCHIVE_DIR, True)):
+        if not directory.exists():
+            continue
+        for path in sorted(directory.glob('*.md')):
+            if path.name.startswith('_'):
+                continue
+            frontmatter, body = parse_frontmatter(path.read_text(encoding='utf-8'))
+            slug = str(frontmatter.get('id', path.stem))
+            key = f"archive/{slug}" if archived else slug
+            pages[key] = {
+                'id': slug,
+                'title': str(frontmatter.get('title', slug)),
+                'archived': archived,
+                'shingles': shingles(page_words(str(frontmatter.get('title', '')),
+                                                as_list(frontmatter.get('tags')), body), shingle_size),
+            }
+    return pages
+
+
+def word_hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def minhash(hashes: list[int], num_perm: int, mask: int) -> tuple:
+    """One-permutation MinHash: bin by h % num_perm, keep the min of h // num_perm per bin, densify."""
+    empty = 1 << 64
+    bins = [empty] * num_perm
+    for h in hashes:
+        h ^= mask
+        b, value = h % num_perm, h // num_perm
+        if value < bins[b]:
+            bins[b] = value
+    if all(value == empty for value in bins):
+        return tuple((0, empty) for _ in range(num_perm))
+    signature = []
+    for b in range(num_perm):
+        distance = 0
+        while bins[(b + distance) % num_perm] == empty:
+            distance += 1
+        signature.append((distance, bins[(b + distance) % num_perm]))
+    return tuple(signature)
+
+
+def band_recall(bands: int, rows: int, similarity: float) -> float:
+    """Chance that a pair with this Jaccard similarity shares at least one band bucket."""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def choose_bands(num_perm: int, threshold: float, recall: float) -> tuple[int, int]:
+    """
+    Pick the most rows per band (fewest candidates) whose recall at the
+    threshold still reaches `recall`; bands = num_perm // rows, so a few
+    signature values may go unused. Falls back to one row per band.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if band_recall(bands, rows, threshold) >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def lsh_candidates(signatures: dict[str, tuple], bands: int, rows: int) -> set[tuple[str, str]]:
+    buckets: dict[tuple, list[str]] = defaultdict(list)
+    for key, signature in signatures.items():
+        for band in range(bands):
+            buckets[(band, signature[band * rows:(band + 1) * rows])].append(key)
+
+    candidates: set[tuple[str, str]] = set()
+    for members in buckets.values():
+        if len(members) > 1:
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add(tuple(sorted((members[i], members[j]))))
+    return candidates
+
+
+def find_clusters(word_sets: dict[str, set], candidates: set[tuple[str, str]], threshold: float) -> list[dict]:
+    """
+    Verify LSH candidates with exact Jaccard, then cluster with complete
+    linkage: two clusters merge only if every cross pair clears the threshold,
+    so unrelated pages are not chained together through a shared neighbour.
+    """
+    pairs = sorted(
+        ((a, b, jaccard(word_sets[a], word_sets[b])) for a, b in candidates),
+        key=lambda p: (-p[2], p[0], p[1]),
+    )
+    pairs = [p for p in pairs if p[2] >= threshold]
+
+    cluster_of: dict[str, list[str]] = {}
+    for a, b, _ in pairs:
+        left = cluster_of.get(a, [a])
+        right = cluster_of.get(b, [b])
+        if left is right:
+            continue
+        if all(jaccard(word_sets[x], word_sets[y]) >= threshold for x in left for y in right):
+            merged = left + right
+            for key in merged:
+                cluster_of[key] = merged
+
+    clusters = []
+    seen: set[int] = set()
+    for members in cluster_of.values():
+        if id(members) in seen:
+            continue
+        seen.add(id(members))
+        member_set = set(members)
+        cluster_pairs = [(a, b, s) for a, b, s in pairs if a in member_set and b in member_set]
+        clusters.append({
+            'members': sorted(members),
+            'maxSimilarity': round(cluster_pairs[0][2], 3),
+            'pairs': [{'a': a, 'b': b, 'similarity': round(s, 3)} for a, b, s in cluster_pairs],
+        })
+    clusters.sort(key=lambda c: (-c['maxSimilarity'], c['members']))
+    return clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threshold', type=float, default=0.5, help='minimum Jaccard similarity of shingle sets')
+    parser.add_argument('--shingle', type=int, default=3, help='words per shingle')
+    parser.add_argument('--recall', type=float, default=0.95, help='target LSH recall for pairs at the threshold')
+    parser.add_argument('--max-df', type=float, default=0.05, help='drop shingles used by more than this share of pages')
+    parser.add_argument('--num-perm', type=int, default=128, help='MinHash signature length')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the MinHash mask')
+    parser.add_argument('--output', help='write the cluster report as JSON')
+    args = parser.parse_args()
+
+    if not ISSUES_DIR.exists():
+        print(f"Error: {ISSUES_DIR} not found.")
+        sys.exit(1)
+
+    pages = load_pages(args.shingle)
+    document_frequency = Counter(shingle for page in pages.values() for shingle in page['shingles'])
+    max_count = args.max_df * len(pages)
+
+    rng = random.Random(args.seed)
+    mask = rng.getrandbits(64)
+    shingle_sets = {
+        key: {s for s in page['shingles'] if document_frequency[s] <= max_count}
+        for key, page in pages.items()
+    }
+    signatures = {key: minhash([word_hash(s) for s in sets], args.num_perm, mask) for key, sets in shingle_sets.items()}
+
+    bands, rows = choose_bands(args.num_perm, args.threshold, args.recall)
+    recall = band_recall(bands, rows, args.threshold)
+    candidates = lsh_candidates(signatures, bands, rows)
+    clusters = find_clusters(shingle_sets, candidates, args.threshold)
+    candidate_count = len(candidates)
+    pair_count = len(pages) * (len(pages) - 1) // 2
+
+    print(f"✓ {len(pages)} pages, {bands} bands × {rows} rows "
+          f"(recall {recall:.3f} at {args.threshold}), {candidate_count} of {pair_count} pairs compared")
+    print(f"✓ {len(clusters)} duplicate cluster(s) at similarity ≥ {args.threshold}\n")
+    for cluster in clusters:
+        print(f"[{cluster['maxSimilarity']:.2f}] " + ', '.join(cluster['members']))
+
+    if args.output:
+        report = {
+            'generatedAt': now_iso(),
+            'parameters': {
+                'threshold': args.threshold, 'shingle': args.shingle, 'maxDf': args.max_df, 'numPerm': args.num_perm,
+                'bands': bands, 'rows': rows, 'recallAtThreshold': round(recall, 4), 'seed': args.seed,
+            },
+            'pages': len(pages),
+            'candidatePairs': candidate_count,
+            'clusters': [
+                {**cluster, 'titles': {key: pages[key]['title'] for key in cluster['members']}}
+                for cluster in clusters
+            ],
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Wrote report to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Build one canonical system registry from every place system names appear.
+
+Sources (read once each, in a single pass):
+  - wiki/systems/*.md              canonical system pages (slug, title, mergedInto)
+  - issue-system-mappings.json     curated names like "Institutions (Policing)"
+  - wiki/issues/*.md               free-form `affectedSystems` frontmatter
+  - data/system-data-flows.json    SW# system walk codes (named via principles-index)
+
+Each canonical system gets a stable integer id, so any set of systems can be
+stored as an integer bitmask. Output: data/system-registry.json with the
+systems, alias table, SW# walk resolution, per-issue masks and an
+unresolved-name report.
+
+JS bitwise operators truncate to 32 bits and there are more than 32
+systems, so masks are written as arrays of `maskWords` 32-bit words,
+least significant first: system id n is bit n % 32 of word n // 32.
+
+Run from anywhere: python3 scripts/normalize-systems.py
+"""
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+
+from wiki_corpus import ROOT, WIKI_DIR, as_list, now_iso, parse_frontmatter, write_artifact
+
+SYSTEMS_DIR = WIKI_DIR / "systems"
+ISSUES_DIR = WIKI_DIR / "issues"
+MAPPINGS_FILE = ROOT / "issue-system-mappings.json"
+FLOWS_FILE = ROOT / "data" / "system-data-flows.json"
+PRINCIPLES_INDEX_FILE = ROOT / "data" / "principles-index.json"
+OUTPUT_FILE = ROOT / "data" / "system-registry.json"
+MASK_WORD_BITS = 32
+
+# Keywords (normalized, lowercase) that resolve free-form names to a canonical
+# system slug. The longest matching keyword wins, so put specific phrases
+# ("border security", "food security") alongside the generic word they override.
+SYSTEM_KEYWORDS = {
+    "climate": [
+        "climate", "environment", "environmental", "atmosphere", "carbon cycle",
+        "ecology", "ecosystem", "ecosystem services", "biodiversity", "ocean",
+        "marine", "conservation", "weather", "weather monitoring", "forestry",
+    ],
+    "culture": [
+        "culture", "cultural", "social", "society", "religion", "religious",
+        "family", "identity", "ethics", "philosophy", "sports", "relationships",
+        "community", "social cohesion", "social structure", "gender", "lgbtq",
+        "heritage", "tourism", "beauty industry", "women's rights",
+    ],
+    "diplomacy": [
+        "diplomacy", "international relations", "geopolitics", "foreign policy",
+        "sanctions", "eu relations", "state relations", "sovereignty",
+    ],
+    "economy": [
+        "economy", "economic", "economics", "labor", "labour", "labor market",
+        "employment", "workforce", "workplace", "finance", "financial", "banking",
+        "business", "industry", "industrial", "manufacturing", "market", "consumer",
+        "wealth", "inequality", "income", "poverty", "insurance", "pensions",
+        "retirement", "real estate", "housing", "credit", "debt", "monetary",
+        "commerce", "productivity", "innovation", "corporate power", "construction",
+        "capital", "social mobility", "social class", "wealth transfer",
+    ],
+    "education": [
+        "education", "research", "science", "scientific", "youth services",
+    ],
+    "geography": [
+        "geography", "land use", "urban", "cities", "rural", "regional",
+        "coastal", "urban planning",
+    ],
+    "healthcare": [
+        "health", "healthcare", "public health", "mental health", "medical",
+        "pharmaceutical", "pharmaceuticals", "pharma", "addiction", "disability",
+        "biosecurity", "death care", "youth wellbeing",
+    ],
+    "infrastructure": [
+        "infrastructure", "transportation", "logistics", "energy grid",
+        "communications", "telecommunications", "water systems", "waste",
+        "waste management", "recycling", "e waste", "aviation", "maritime", "gps",
+        "navigation", "space infrastructure", "emergency services",
+        "emergency response",
+    ],
+    "institutions": [
+        "institutions", "legal", "law", "judiciary", "judicial", "justice",
+        "constitutional", "regulation", "regulatory", "governance", "government",
+        "human rights", "civil rights", "civil liberties", "rights", "privacy",
+        "congressional authority", "executive power", "consumer protection",
+        "consumer rights", "intellectual property",
+    ],
+    "institutions-policing": [
+        "policing", "law enforcement", "criminal justice", "crime", "criminal",
+        "public safety", "security forces", "border security", "surveillance",
+    ],
+    "international-organizations": [
+        "international orgs", "international organizations", "nato", "african union",
+        "eu institutions", "international law", "international governance",
+        "global governance", "humanitarian", "international development",
+    ],
+    "media": [
+        "media", "information", "journalism", "social media", "internet platforms",
+        "information integrity",
+    ],
+    "military": [
+        "military", "defense", "security", "national security", "nuclear",
+        "nuclear proliferation", "intelligence", "regional security",
+        "international security", "gun industry",
+    ],
+    "pandemic": [
+        "pandemic", "epidemic", "disease surveillance",
+    ],
+    "politics": [
+        "politics", "political", "democracy", "democratic", "elections",
+        "electoral", "polarization", "civil society", "national identity",
+    ],
+    "politics-policy": [
+        "policy", "government policy", "climate policy",
+    ],
+    "population": [
+        "population", "demographics", "demographic", "migration", "immigration",
+        "refugees", "displacement", "minorities", "indigenous", "population dynamics",
+    ],
+    "population-cohorts": [
+        "cohorts", "youth", "generational",
+    ],
+    "population-movements": [
+        "movements", "social movements", "protest",
+    ],
+    "public-finance": [
+        "public finance", "tax", "tax revenue", "government finance", "municipal",
+        "government services", "public services", "social services",
+        "social welfare", "local government",
+    ],
+    "resources": [
+        "resources", "energy", "agriculture", "agricultural", "food",
+        "food security", "food systems", "water", "fishing", "natural resources",
+        "resource extraction", "extractive", "commodity", "petrochemicals", "mining",
+    ],
+    "technology": [
+        "technology", "tech", "ai", "ai development", "software", "digital",
+        "digital economy", "internet", "biotechnology", "cybersecurity",
+        "space industry",
+    ],
+    "trade": [
+        "trade", "global trade", "supply chain", "international trade",
+        "trade routes", "trade and logistics",
+    ],
+}
+
+CAMEL_BOUNDARY = re.compile(r'(?<=[a-z])(?=[A-Z])')
+SEPARATORS = re.compile(r'[\s\-_/]+')
+PARENS = re.compile(r'\s*\(([^)]*)\)')
+WALK_CODE = re.compile(r'^SW#0*(\d+)([a-z]?)', re.IGNORECASE)
+WALK_SOURCE = re.compile(r'^\d+[a-z]?-(.+)-ARCHITECTURE\.md$')
+
+
+def normalize_name(raw: str) -> str:
+    """'CriminalJustice', 'criminal-justice' and 'Criminal Justice' all become 'criminal justice'."""
+    text = CAMEL_BOUNDARY.sub(' ', str(raw).strip())
+    text = text.replace('&', ' and ').replace('+', '')
+    return SEPARATORS.sub(' ', text).strip().lower()
+
+
+def normalize_walk(code: str) -> str:
+    match = WALK_CODE.match(code.strip())
+    if not match:
+        return code.strip()
+    return f"SW#{int(match.group(1)):02d}{match.group(2).lower()}"
+
+
+def split_names(raw) -> list[str]:
+    """Some frontmatter lists were written as one quoted string: "Women's Rights, Legal Systems"."""
+    return [part.strip() for part in str(raw).split(',') if part.strip()]
+
+
+def mask_words(mask: int, words: int) -> list[int]:
+    """An integer mask as `words` unsigned 32-bit words, least significant first."""
+    return [(mask >> (MASK_WORD_BITS * i)) & 0xFFFFFFFF for i in range(words)]
+
+
+class Registry:
+    def __init__(self, system_pages: list[dict]):
+        active = [p for p in system_pages if not p.get('mergedInto')]
+        self.systems = [
+            {'id': i, 'slug': p['id'], 'name': p['title'], 'domain': p.get('domain', ''), 'aliases': []}
+            for i, p in enumerate(sorted(active, key=lambda p: p['id']))
+        ]
+        self.by_slug = {s['slug']: s['id'] for s in self.systems}
+        self.aliases: dict[str, int] = {}
+        self.unresolved: Counter = Counter()
+
+        for system in self.systems:
+            self.add_alias(system['slug'], system['id'])
+            self.add_alias(system['name'], system['id'])
+        for page in system_pages:
+            target = page.get('mergedInto')
+            if target in self.by_slug:
+                self.add_alias(page['id'], self.by_slug[target])
+                self.add_alias(page['title'], self.by_slug[target])
+
+        self.keywords = sorted(
+            ((normalize_name(kw), self.by_slug[slug]) for slug, kws in SYSTEM_KEYWORDS.items()
+             if slug in self.by_slug for kw in kws),
+            key=lambda item: -len(item[0]),
+        )
+
+    def add_alias(self, raw: str, system_id: int) -> None:
+        key = normalize_name(raw)
+        if key and key not in self.aliases:
+            self.aliases[key] = system_id
+            if raw not in self.systems[system_id]['aliases']:
+                self.systems[system_id]['aliases'].append(raw)
+
+    def match_keywords(self, key: str) -> int | None:
+        # Strip filler words so "Healthcare Systems" and "Banking Sector" reach their keyword
+        padded = f" {re.sub(r' (systems?|sector|networks?|markets)$', '', key)} "
+        for keyword, system_id in self.keywords:
+            if f" {keyword} " in padded or f" {keyword}s " in padded:
+                return system_id
+        return None
+
+    def lookup(self, raw: str) -> int | None:
+        """Alias table, then keywords, then the name without its parenthetical; never mutates."""
+        key = normalize_name(raw)
+        if key in self.aliases:
+            return self.aliases[key]
+        system_id = self.match_keywords(key)
+        if system_id is None:
+            # "Institutions (International Relations)" falls back to its parent system
+            bare = normalize_name(PARENS.sub('', str(raw)))
+            system_id = self.aliases.get(bare)
+        return system_id
+
+    def resolve(self, raw: str) -> int | None:
+        """lookup() that records the name as an alias, or counts it as unresolved."""
+        system_id = self.lookup(raw)
+        if system_id is None:
+            self.unresolved[str(raw)] += 1
+            return None
+        self.add_alias(raw, system_id)
+        return system_id
+
+    def mask(self, names) -> int:
+        mask = 0
+        for raw in as_list(names):
+            for name in split_names(raw):
+                system_id = self.resolve(name)
+                if system_id is not None:
+                    mask |= 1 << system_id
+        return mask
+
+
+def load_system_pages() -> list[dict]:
+    pages = []
+    for path in sorted(SYSTEMS_DIR.glob('*.md')):
+        if path.name.startswith('_'):
+            continue
+        frontmatter, _ = parse_frontmatter(path.read_text(encoding='utf-8'))
+        frontmatter.setdefault('id', path.stem)
+        frontmatter.setdefault('title', path.stem)
+        pages.append(frontmatter)
+    return pages
+
+
+def load_walk_names() -> dict[str, str]:
+    """SW# code → source slug, e.g. SW#14 → 'urban-heat-island', from principles-index."""
+    if not PRINCIPLES_INDEX_FILE.exists():
+        return {}
+    walks: dict[str, str] = {}
+    for entry in json.loads(PRINCIPLES_INDEX_FILE.read_text(encoding='utf-8')).get('principles', []):
+        source = WALK_SOURCE.match(entry.get('sourceFile', ''))
+        if source:
+            walks.setdefault(normalize_walk(entry.get('system', '')), source.group(1))
+    return walks
+
+
+def build(registry: Registry) -> dict:
+    issue_masks: dict[str, int] = {}
+
+    # Issue frontmatter
+    for path in sorted(ISSUES_DIR.glob('*.md')):
+        if path.name.startswith('_'):
+            continue
+        frontmatter, _ = parse_frontmatter(path.read_text(encoding='utf-8'))
+        issue_id = str(frontmatter.get('id', path.stem))
+        issue_masks[issue_id] = issue_masks.get(issue_id, 0) | registry.mask(frontmatter.get('affectedSystems'))
+
+    # Curated mappings
+    mapping_names: list[str] = []
+    if MAPPINGS_FILE.exists():
+        mappings = json.loads(MAPPINGS_FILE.read_text(encoding='utf-8'))
+        mapping_names = mappings.get('metadata', {}).get('systemsAvailable', [])
+        registry.mask(mapping_names)
+        for mapping in mappings.get('mappings', []):
+            issue_id = mapping['issueId']
+            issue_masks[issue_id] = issue_masks.get(issue_id, 0) | registry.mask(mapping.get('systems'))
+
+    # SW# walk codes: a walk is either a system itself (SW#01 climate) or an
+    # issue walk whose systems come from that issue's resolved mask.
+    walk_names = load_walk_names()
+    walks: dict[str, dict] = {}
+    if FLOWS_FILE.exists():
+        flows = json.loads(FLOWS_FILE.read_text(encoding='utf-8')).get('flows', [])
+        codes = sorted({normalize_walk(f[k]) for f in flows for k in ('source', 'target')})
+        for code in codes:
+            slug = walk_names.get(code)
+            walk: dict = {'slug': slug, 'system': None, 'mask': 0}
+            if slug in registry.by_slug:
+                walk['system'] = registry.by_slug[slug]
+                walk['mask'] = 1 << walk['system']
+                registry.add_alias(code, walk['system'])
+            elif slug in issue_masks:
+                walk['mask'] = issue_masks[slug]
+            walks[code] = walk
+
+    words = -(-len(registry.systems) // MASK_WORD_BITS)
+    for walk in walks.values():
+        walk['mask'] = mask_words(walk['mask'], words)
+
+    return {
+        'generatedAt': now_iso(),
+        'maskWords': words,
+        'systems': registry.systems,
+        'aliases': dict(sorted(registry.aliases.items())),
+        'walks': walks,
+        'issues': {issue_id: mask_words(mask, words) for issue_id, mask in sorted(issue_masks.items())},
+        'unresolved': dict(registry.unresolved.most_common()),
+        'stats': {
+            'systems': len(registry.systems),
+            'aliases': len(registry.aliases),
+            'mappingSystems': len(mapping_names),
+            'issues': len(issue_masks),
+            'issuesWithoutSystems': sum(1 for mask in issue_masks.values() if not mask),
+            'walks': len(walks),
+            'walksResolved': sum(1 for walk in walks.values() if any(walk['mask'])),
+            'unresolvedNames': len(registry.unresolved),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=str(OUTPUT_FILE), help='registry path')
+    args = parser.parse_args()
+
+    if not SYSTEMS_DIR.exists():
+        print(f"Error: {SYSTEMS_DIR} not found.")
+        sys.exit(1)
+
+    registry = Registry(load_system_pages())
+    result = build(registry)
+
+    write_artifact(args.output, result, indent=2)
+
+    stats = result['stats']
+    print(f"✓ {stats['systems']} canonical systems, {stats['aliases']} aliases")
+    print(f"✓ {stats['issues']} issues masked ({stats['issuesWithoutSystems']} without systems)")
+    print(f"✓ {stats['walksResolved']}/{stats['walks']} SW# walks resolved")
+    if result['unresolved']:
+        print(f"\nUnresolved names ({stats['unresolvedNames']}):")
+        for name, count in list(result['unresolved'].items())[:15]:
+            print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Find (and optionally rewrite) real-world names that leaked into the wiki.
+
+Every entry of the public/shadow-*-map.json files is expanded into the
+surface forms it takes in prose (ARUBA → "Aruba", "ARUBA"; SOUTH_KOREA →
+"South Korea", "SOUTH KOREA", "SOUTH_KOREA"), and all forms are compiled
+into a single regex built from a character trie. Shared prefixes are
+matched once, so each file is scanned in one pass no matter how many names
+are in the maps, and the longest name wins ("Guinea-Bissau" never reports
+"Guinea"). Files are scanned in parallel worker processes.
+
+Prose maps (countries, languages) match title-case and upper-case forms.
+Identifier maps (culture profiles, ethnolinguistic ids) match the exact id
+only and are off by default, since ids like "japanese" are also words.
+Names inside slugs and links (japan-demographic-collapse) are never
+touched.
+
+Report-only by default. --write rewrites files in place; --check exits 1
+when anything is found.
+
+Run from anywhere: python3 scripts/rewrite-shadow-names.py [--maps country,language] [--write] [--output report.json]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from wiki_corpus import ROOT, WIKI_DIR, now_iso
+
+PUBLIC_DIR = ROOT / "public"
+
+# map name → whether its entries are prose names (True) or identifiers (False)
+MAPS = {
+    'country': True,
+    'language': True,
+    'culture': False,
+    'ethnolinguistic': False,
+}
+DEFAULT_MAPS = ('country', 'language')
+
+SMALL_WORDS = {'and', 'the', 'of', 'da'}
+
+# A name must not be glued to a word, a slug hyphen, a path or an id prefix
+BEFORE = r'(?<![\w/:-])'
+AFTER = r'(?![\w-])'
+
+# Set per worker process by init_worker
+_PATTERN: re.Pattern | None = None
+_REPLACEMENTS: dict[str, str] = {}
+
+
+def title_case(words: list[str]) -> str:
+    return ' '.join(
+        w if i and w in SMALL_WORDS else w.capitalize()
+        for i, w in enumerate(words)
+    )
+
+
+def surface_forms(real: str, prose: bool) -> set[str]:
+    if not prose:
+        return {real}
+    words = real.replace('_', ' ').lower().split()
+    spaced = title_case(words)
+    return {spaced, spaced.upper(), real, real.upper().replace(' ', '_')}
+
+
+def load_replacements(map_names: list[str], ignore: set[str]) -> dict[str, str]:
+    """Surface form → shadow name, across all selected maps."""
+    replacements: dict[str, str] = {}
+    for name in map_names:
+        path = PUBLIC_DIR / f"shadow-{name}-map.json"
+        for entry in json.loads(path.read_text(encoding='utf-8')):
+            if entry['real'].casefold() in ignore:
+                continue
+            for form in surface_forms(entry['real'], MAPS[name]):
+                replacements.setdefault(form, entry['shadow'])
+    return replacements
+
+
+def trie_regex(words) -> str:
+    """
+    Compile literal strings into one regex that follows a character trie:
+    alternatives only branch where the strings diverge, and a longer
+    continuation is always tried before stopping at a shorter word.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            return f'(?:{body})?'
+        return body
+
+    return build(trie)
+
+
+def compile_pattern(replacements: dict[str, str]) -> re.Pattern:
+    return re.compile(BEFORE + '(' + trie_regex(replacements) + ')' + AFTER)
+
+
+def init_worker(replacements: dict[str, str]) -> None:
+    global _PATTERN, _REPLACEMENTS
+    _REPLACEMENTS = replacements
+    _PATTERN = compile_pattern(replacements)
+
+
+def process_file(path: str, write: bool) -> tuple[str, list[tuple[int, str]], bool]:
+    """Scan one file; returns (path, [(line, name)], rewritten)."""
+    content = Path(path).read_text(encoding='utf-8')
+    hits: list[tuple[int, str]] = []
+    line, last = 1, 0
+    for match in _PATTERN.finditer(content):
+        line += content.count('\n', last, match.start())
+        last = match.start()
+        hits.append((line, match.group(1)))
+    if not hits or not write:
+        return path, hits, False
+
+    rewritten = _PATTERN.sub(lambda m: _REPLACEMENTS[m.group(1)], content)
+    Path(path).write_text(rewritten, encoding='utf-8')
+    return path, hits, True
+
+
+def collect_files(paths: list[str]) -> list[str]:
+    files: list[str] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(str(p) for p in sorted(path.rglob('*.md')))
+        elif path.exists():
+            files.append(str(path))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='*', default=[str(WIKI_DIR)], help='files or directories (default: wiki/)')
+    parser.add_argument('--maps', default=','.join(DEFAULT_MAPS),
+                        help=f"comma-separated maps to use, or 'all' ({', '.join(MAPS)})")
+    parser.add_argument('--ignore', action='append', default=[], metavar='NAME',
+                        help='real name to skip (e.g. GEORGIA); repeatable')
+    parser.add_argument('--write', action='store_true', help='rewrite matches to their shadow names')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any real name is found')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--top', type=int, default=20, help='names listed in the summary')
+    parser.add_argument('--output', help='write the full report as JSON')
+    args = parser.parse_args()
+
+    map_names = list(MAPS) if args.maps == 'all' else [m.strip() for m in args.maps.split(',') if m.strip()]
+    unknown = [m for m in map_names if m not in MAPS]
+    if unknown:
+        print(f"Error: unknown map(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    replacements = load_replacements(map_names, {name.casefold() for name in args.ignore})
+    files = collect_files(args.paths)
+    if not files:
+        print("Error: no files to scan.")
+        sys.exit(1)
+
+    if args.jobs > 1:
+        with ProcessPoolExecutor(args.jobs, initializer=init_worker, initargs=(replacements,)) as pool:
+            results = list(pool.map(process_file, files, [args.write] * len(files), chunksize=32))
+    else:
+        init_worker(replacements)
+        results = [process_file(path, args.write) for path in files]
+
+    names: Counter = Counter()
+    by_file: dict[str, list[tuple[int, str]]] = {}
+    rewritten = 0
+    for path, hits, changed in results:
+        if hits:
+            by_file[os.path.relpath(path, ROOT)] = hits
+            names.update(name for _, name in hits)
+        rewritten += changed
+
+    total = sum(names.values())
+    print(f"✓ Scanned {len(files)} files for {len(replacements)} name forms ({', '.join(map_names)})")
+    print(f"{'✓' if not total else '✗'} {total} real-name occurrence(s) in {len(by_file)} file(s)")
+    for name, count in names.most_common(args.top):
+        print(f"  {count:6d}  {name} → {replacements[name]}")
+    if args.write:
+        print(f"✓ Rewrote {rewritten} file(s)")
+
+    if args.output:
+        report = {
+            'generatedAt': now_iso(),
+            'maps': map_names,
+            'filesScanned': len(files),
+            'occurrences': total,
+            'names': {name: {'shadow': replacements[name], 'count': count} for name, count in names.most_common()},
+            'files': {
+                path: [{'line': line, 'name': name} for line, name in hits]
+                for path, hits in sorted(by_file.items())
+            },
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✓ Wrote report to {args.output}")
+
+    if args.check and total:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
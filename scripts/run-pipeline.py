@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware runner for the site data pipeline.
+
+Each stage declares its command, input globs and output globs. Stage order
+is derived from the overlap between one stage's outputs and another's
+inputs; independent stages run in parallel. Before running a stage the
+runner hashes its inputs (plus the command): if that digest was seen before
+and the recorded outputs are still on disk, the stage is skipped, and if
+the outputs were changed or removed they are restored from the
+content-addressed object store in .pipeline-cache/ instead of re-running.
+A hand-edited output is not lost: it is saved to the object store first
+and the runner warns with the path of the saved copy.
+
+Usage:
+  python3 scripts/run-pipeline.py                   # everything that is stale
+  python3 scripts/run-pipeline.py extract-data      # a stage and its upstream stages
+  python3 scripts/run-pipeline.py --dry-run         # show what would run
+  python3 scripts/run-pipeline.py --force --jobs 1
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from wiki_corpus import ROOT
+
+CACHE_DIR = ROOT / ".pipeline-cache"
+STATE_FILE = CACHE_DIR / "state.json"
+OBJECTS_DIR = CACHE_DIR / "objects"
+STATE_VERSION = 1
+HISTORY_LIMIT = 8  # digests remembered per stage
+
+
+@dataclass
+class Stage:
+    name: str
+    command: list[str]
+    inputs: list[str]
+    outputs: list[str]
+    description: str = ''
+    after: list[str] = field(default_factory=list)
+
+
+PY = sys.executable or "python3"
+
+STAGES = [
+    Stage(
+        name="principles-index",
+        description="wiki/principles → data/principles-index.json (incremental)",
+        command=[PY, "scripts/build-principles-index.py"],
+        inputs=["wiki/principles/*.md", "scripts/build-principles-index.py", "scripts/wiki_corpus.py"],
+        outputs=["data/principles-index.json"],
+    ),
+    Stage(
+        name="system-flows",
+        description="data/system-data-flows.json → data/system-flow-graph.json",
+        command=[PY, "scripts/compile-system-flows.py"],
+        inputs=["data/system-data-flows.json", "scripts/compile-system-flows.py", "scripts/wiki_corpus.py"],
+        outputs=["data/system-flow-graph.json"],
+    ),
+    Stage(
+        name="mechanics-tags",
+        description="tag wiki/issues pages that still have `mechanics: []`",
+        command=[PY, "scripts/apply-mechanics-tags.py"],
+        inputs=["wiki/issues/*.md", "wiki/mechanics/*.md", "scripts/apply-mechanics-tags.py"],
+        outputs=["wiki/issues/*.md"],
+    ),
+    Stage(
+        name="system-registry",
+        description="canonical system registry from wiki/systems, issues, mappings and flows",
+        command=[PY, "scripts/normalize-systems.py"],
+        inputs=[
+            "wiki/systems/*.md", "wiki/issues/*.md", "issue-system-mappings.json",
+            "data/system-data-flows.json", "data/principles-index.json",
+            "scripts/normalize-systems.py", "scripts/wiki_corpus.py",
+        ],
+        outputs=["data/system-registry.json"],
+    ),
+    Stage(
+        name="extract-data",
+        description="pnpm extract-data → public/data.json (needs the parent Shadow Work repo)",
+        command=["pnpm", "extract-data"],
+        inputs=[
+            "wiki/**/*.md", "data/principles-index.json", "data/system-data-flows.json",
+            "issue-system-mappings.json", "multi-category-all-issues.json",
+            "scripts/extract-data.ts", "scripts/parse-wiki.ts",
+            "../data/issues/*.yaml", "../data/agent-generation/v1/vocab.json",
+            "../data/generated/**/*.json", "../data/country-shadow-map.json",
+            "../docs/technical/simulation-systems/**/*.md",
+            "../docs/technical/simulation-systems/*.json",
+            "../docs/technical/simulation-primitives-mapping.json",
+        ],
+        outputs=[
+            "public/data.json", "public/agent-vocab.v1.json",
+            "public/agent-priors.v1.json", "public/shadow-country-map.json",
+        ],
+    ),
+    Stage(
+        name="infra-tech-connections",
+        description="validate issue-issue-connections.json (merging stays manual)",
+        command=[PY, "scripts/add-infra-tech-connections.py", "--check", "--report", "data/connections-report.json"],
+        inputs=["public/data.json", "issue-issue-connections.json", "scripts/add-infra-tech-connections.py"],
+        outputs=["data/connections-report.json"],
+    ),
+    Stage(
+        name="link-graph",
+        description="wiki cross-links → data/wiki-link-graph.json + broken/ambiguous report",
+        command=[PY, "scripts/build-link-graph.py"],
+        inputs=["wiki/**/*.md", "public/data.json", "scripts/build-link-graph.py", "scripts/wiki_corpus.py"],
+        outputs=["data/wiki-link-graph.json"],
+    ),
+    Stage(
+        name="issue-cascades",
+        description="Monte Carlo shock propagation → data/issue-cascades.json",
+        command=[PY, "scripts/simulate-cascades.py"],
+        inputs=[
+            "wiki/issues/*.md", "issue-issue-connections.json", "public/data.json",
+            "scripts/simulate-cascades.py", "scripts/wiki_corpus.py",
+        ],
+        outputs=["data/issue-cascades.json"],
+    ),
+]
+
+
+# --- Hashing ----------------------------------------------------------------
+
+class FileHasher:
+    """sha256 per file, memoized on (mtime, size) across runs."""
+
+    def __init__(self, memo: dict):
+        self.memo = memo
+        self.lock = threading.Lock()
+
+    def hash(self, path: Path) -> str:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return "missing"
+        key = str(path)
+        with self.lock:
+            cached = self.memo.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        with self.lock:
+            self.memo[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+
+def expand(patterns: list[str]) -> list[Path]:
+    paths: set[Path] = set()
+    for pattern in patterns:
+        if any(ch in pattern for ch in '*?['):
+            base = ROOT
+            while pattern.startswith('../'):
+                base, pattern = base.parent, pattern[3:]
+            paths.update(p for p in base.glob(pattern) if p.is_file())
+        else:
+            paths.add((ROOT / pattern).resolve())
+    return sorted(paths)
+
+
+def inputs_digest(stage: Stage, hasher: FileHasher) -> str:
+    digest = hashlib.sha256(json.dumps(stage.command[1:]).encode())
+    for path in expand(stage.inputs):
+        digest.update(str(path).encode())
+        digest.update(hasher.hash(path).encode())
+    return digest.hexdigest()
+
+
+def output_hashes(stage: Stage, hasher: FileHasher) -> dict[str, str]:
+    return {
+        os.path.relpath(path, ROOT): hasher.hash(path)
+        for path in expand(stage.outputs)
+        if path.exists()
+    }
+
+
+# --- Object store -----------------------------------------------------------
+
+def store_objects(outputs: dict[str, str]) -> None:
+    for rel, digest in outputs.items():
+        target = OBJECTS_DIR / digest[:2] / digest
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(ROOT / rel, target)
+
+
+def restore_objects(outputs: dict[str, str], hasher: FileHasher) -> bool:
+    """Bring outputs back to the recorded content. False if any object is missing."""
+    pending = {rel: digest for rel, digest in outputs.items() if hasher.hash(ROOT / rel) != digest}
+    if any(not (OBJECTS_DIR / d[:2] / d).exists() for d in pending.values()):
+        return False
+    for rel, digest in pending.items():
+        path = ROOT / rel
+        if path.exists():
+            local = hasher.hash(path)
+            store_objects({rel: local})
+            print(f"⚠ {rel} differs from its recorded output; restoring it "
+                  f"(local copy saved as {os.path.relpath(OBJECTS_DIR / local[:2] / local, ROOT)})")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(OBJECTS_DIR / digest[:2] / digest, path)
+    return True
+
+
+# --- Graph ------------------------------------------------------------------
+
+def overlaps(outputs: list[str], inputs: list[str]) -> bool:
+    return any(fnmatch.fnmatch(out, pattern) or fnmatch.fnmatch(pattern, out) for out in outputs for pattern in inputs)
+
+
+def build_graph(stages: list[Stage]) -> dict[str, set[str]]:
+    """stage name → names of stages it must wait for (listed earlier and writing its inputs)."""
+    deps: dict[str, set[str]] = {}
+    for i, stage in enumerate(stages):
+        deps[stage.name] = set(stage.after)
+        for upstream in stages[:i]:
+            if overlaps(upstream.outputs, stage.inputs):
+                deps[stage.name].add(upstream.name)
+    return deps
+
+
+def select(stages: list[Stage], deps: dict[str, set[str]], targets: list[str]) -> list[Stage]:
+    if not targets:
+        return stages
+    wanted: set[str] = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return [stage for stage in stages if stage.name in wanted]
+
+
+# --- Runner -----------------------------------------------------------------
+
+def load_state() -> dict:
+    try:
+        state = json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"version": STATE_VERSION, "stages": {}, "hashes": {}}
+    if state.get("version") != STATE_VERSION:
+        return {"version": STATE_VERSION, "stages": {}, "hashes": {}}
+    return state
+
+
+def save_state(state: dict) -> None:
+    CACHE_DIR.mkdir(exist_ok=True)
+    STATE_FILE.write_text(json.dumps(state), encoding='utf-8')
+
+
+def remember(history: list, key: str, outputs: dict[str, str]) -> None:
+    history[:] = [entry for entry in history if entry["key"] != key]
+    history.insert(0, {"key": key, "outputs": outputs})
+    del history[HISTORY_LIMIT:]
+
+
+def run_stage(stage: Stage, state: dict, hasher: FileHasher, force: bool, dry_run: bool) -> tuple[str, float]:
+    """Returns (status, seconds) where status is skipped / restored / ran / would-run."""
+    start = time.perf_counter()
+    history = state["stages"].setdefault(stage.name, [])
+    key = inputs_digest(stage, hasher)
+
+    if not force:
+        for entry in history:
+            if entry["key"] != key:
+                continue
+            if output_hashes(stage, hasher) == entry["outputs"]:
+                return "skipped", time.perf_counter() - start
+            if not dry_run and restore_objects(entry["outputs"], hasher):
+                return "restored", time.perf_counter() - start
+            break
+
+    if dry_run:
+        return "would-run", time.perf_counter() - start
+
+    try:
+        result = subprocess.run(stage.command, cwd=ROOT, capture_output=True, text=True)
+    except OSError as error:
+        raise RuntimeError(f"{stage.name} could not start: {error}") from error
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"{stage.name} failed ({result.returncode}): {' '.join(stage.command)}\n"
+            f"{(result.stdout + result.stderr).strip()[-2000:]}"
+        )
+
+    outputs = output_hashes(stage, hasher)
+    store_objects(outputs)
+    remember(history, key, outputs)
+    # In-place stages (e.g. mechanics-tags) rewrite their own inputs; remember
+    # the post-run digest too so an unchanged tree is a no-op next time.
+    post_key = inputs_digest(stage, hasher)
+    if post_key != key:
+        remember(history, post_key, outputs)
+    return "ran", time.perf_counter() - start
+
+
+def run(stages: list[Stage], deps: dict[str, set[str]], jobs: int, force: bool, dry_run: bool) -> bool:
+    state = load_state()
+    hasher = FileHasher(state.setdefault("hashes", {}))
+    names = {stage.name for stage in stages}
+    waiting = {stage.name: deps[stage.name] & names for stage in stages}
+    by_name = {stage.name: stage for stage in stages}
+    done: set[str] = set()
+    failed = False
+    lock = threading.Lock()
+
+    def task(stage: Stage):
+        status, seconds = run_stage(stage, state, hasher, force, dry_run)
+        with lock:
+            print(f"  {status:<9} {stage.name:<24} {seconds:7.2f}s")
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while waiting or running:
+                if not failed:
+                    for name in [n for n, d in waiting.items() if d <= done]:
+                        del waiting[name]
+                        running[pool.submit(task, by_name[name])] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                    except RuntimeError as error:
+                        failed = True
+                        print(f"✗ {error}")
+    finally:
+        # Keep what the finished stages recorded even if a later one failed
+        if not dry_run:
+            save_state(state)
+    for name in waiting:
+        print(f"  blocked   {name}")
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', help='stages to bring up to date (default: all)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 2, help='parallel stages')
+    parser.add_argument('--force', action='store_true', help='run stages even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='report stale stages without running them')
+    parser.add_argument('--list', action='store_true', help='list stages and their dependencies')
+    args = parser.parse_args()
+
+    deps = build_graph(STAGES)
+    if args.list:
+        for stage in STAGES:
+            after = ', '.join(sorted(deps[stage.name])) or '-'
+            print(f"{stage.name:<24} after: {after}\n  {stage.description}")
+        return
+
+    unknown = [t for t in args.targets if t not in deps]
+    if unknown:
+        print(f"Error: unknown stage(s): {', '.join(unknown)}. See --list.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    ok = run(select(STAGES, deps, args.targets), deps, max(1, args.jobs), args.force, args.dry_run)
+    print(f"\n{'✓' if ok else '✗'} pipeline finished in {time.perf_counter() - start:.2f}s")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
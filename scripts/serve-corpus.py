@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Local read-only HTTP/JSON query service over the issue and principle corpus.
+
+Loads wiki/issues, wiki/principles, issue-issue-connections.json and
+issue-system-mappings.json once and keeps keyed indexes in memory, so
+editor plugins and scripts can ask questions without re-walking wiki/:
+
+  GET /health                           counts, generation, cache stats, unreadable files
+  GET /issues?mechanic=&system=&category=&primitive=&tag=&limit=
+                                        issues matching every given key
+  GET /issues/<id>                      one issue: frontmatter fields, systems,
+                                        connections and its principles
+  GET /connections/<id>                 outgoing, incoming and frontmatter links
+  GET /principles?issue=&walk=&q=       principles by source issue, SW# walk or text
+  GET /facets/<index>                   keys of one index with issue counts
+
+Systems resolve through the same Registry as normalize-systems.py, so
+?system= takes a slug, a name or any alias ("Healthcare Systems").
+Mechanics match the full id or its pattern part (?mechanic=threshold).
+
+Answers are cached in an LRU keyed by path and query. At most every
+--interval seconds a request first checks file mtimes: changed pages are
+re-parsed and re-indexed one by one, changed JSON files are reloaded, and
+the cache is dropped only when something actually changed.
+
+Binds to 127.0.0.1 only. --query answers one request on stdout without
+starting a server.
+
+Run from anywhere: python3 scripts/serve-corpus.py [--port 8765] [--query '/issues?mechanic=threshold']
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from wiki_corpus import ROOT, WIKI_DIR, as_list, load_script, parse_frontmatter
+
+ISSUES_DIR = WIKI_DIR / "issues"
+PRINCIPLES_DIR = WIKI_DIR / "principles"
+SYSTEMS_DIR = WIKI_DIR / "systems"
+CONNECTIONS_FILE = ROOT / "issue-issue-connections.json"
+MAPPINGS_FILE = ROOT / "issue-system-mappings.json"
+
+INDEXES = ('mechanic', 'system', 'category', 'primitive', 'tag')
+CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+
+class QueryError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def kebab(value: str) -> str:
+    """'DeathSpiral' and 'Death Spiral' both become 'death-spiral'."""
+    return re.sub(r'[^a-z0-9]+', '-', CAMEL_BOUNDARY.sub('-', str(value).strip()).lower()).strip('-')
+
+
+def mechanic_keys(mechanic_id: str) -> set[str]:
+    """mechanic--threshold--confidencethreshold is found by its id, 'threshold' or 'confidencethreshold'."""
+    keys = {mechanic_id}
+    parts = mechanic_id.split('--')
+    if len(parts) == 3 and parts[0] == 'mechanic':
+        keys.update(parts[1:])
+    return keys
+
+
+def scan(directory) -> dict[str, int]:
+    if not os.path.isdir(directory):
+        return {}
+    mtimes = {}
+    for entry in os.scandir(directory):
+        if entry.name.endswith('.md') and not entry.name.startswith('_'):
+            try:
+                mtimes[entry.name] = entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # removed between listing and stat
+    return mtimes
+
+
+def file_mtime(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+class Corpus:
+    """Resident issue/principle records plus key → id indexes, refreshed by mtime."""
+
+    def __init__(self):
+        self.systems_module = load_script('normalize-systems')
+        self.generation = 0
+        self.issues: dict[str, dict] = {}  # id → record
+        self.issue_files: dict[str, str] = {}  # filename → id
+        self.principles: dict[str, dict] = {}
+        self.principle_files: dict[str, str] = {}
+        self.indexes: dict[str, dict[str, set[str]]] = {name: defaultdict(set) for name in INDEXES}
+        self.by_source: dict[str, set[str]] = defaultdict(set)  # issue slug → principle ids
+        self.by_walk: dict[str, set[str]] = defaultdict(set)
+        self.outgoing: dict[str, list[dict]] = {}
+        self.incoming: dict[str, list[dict]] = {}
+        self.mapped_systems: dict[str, list[str]] = {}
+        self.mtimes: dict[str, dict[str, int]] = {'issues': {}, 'principles': {}}
+        self.file_mtimes: dict[str, object] = {}
+        self.unreadable: dict[str, str] = {}  # file → error, retried on every refresh
+        self.registry = None
+        self.refresh()
+
+    # --- Loading ------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Pick up changed files. Returns True when anything changed."""
+        changed = False
+        registry_mtime = (max(scan(SYSTEMS_DIR).values(), default=0), file_mtime(MAPPINGS_FILE))
+        if registry_mtime != self.file_mtimes.get('registry'):
+            changed |= self.reload('registry', registry_mtime, self.load_registry)
+
+        changed |= self.sync_dir('issues', ISSUES_DIR, self.issue_files, self.index_issue, self.drop_issue)
+        changed |= self.sync_dir('principles', PRINCIPLES_DIR, self.principle_files,
+                                 self.index_principle, self.drop_principle)
+
+        connections_mtime = file_mtime(CONNECTIONS_FILE)
+        if connections_mtime != self.file_mtimes.get('connections'):
+            changed |= self.reload('connections', connections_mtime, self.load_connections)
+
+        if changed:
+            self.generation += 1
+        return changed
+
+    def reload(self, key: str, mtime, load) -> bool:
+        """Run a whole-file loader; if the file is unreadable keep the old data and retry next refresh."""
+        try:
+            load()
+        except (OSError, ValueError) as error:
+            self.unreadable[key] = str(error)
+            return False
+        self.unreadable.pop(key, None)
+        self.file_mtimes[key] = mtime
+        return True
+
+    def sync_dir(self, name, directory, files: dict[str, str], index, drop) -> bool:
+        current = scan(directory)
+        previous = self.mtimes[name]
+        changed = False
+        for filename in previous.keys() - current.keys():
+            drop(files.pop(filename))
+            self.unreadable.pop(f"{name}/{filename}", None)
+            changed = True
+        for filename, mtime in list(current.items()):
+            if previous.get(filename) == mtime:
+                continue
+            try:
+                frontmatter, _ = parse_frontmatter((directory / filename).read_text(encoding='utf-8'))
+            except (OSError, UnicodeDecodeError) as error:
+                # Caught mid-save or removed since the scan: keep the old record, and
+                # leave the old mtime in place so the next refresh tries again
+                self.unreadable[f"{name}/{filename}"] = str(error)
+                if filename in previous:
+                    current[filename] = previous[filename]
+                else:
+                    del current[filename]
+                continue
+            self.unreadable.pop(f"{name}/{filename}", None)
+            if filename in files:
+                drop(files.pop(filename))
+            files[filename] = index(frontmatter, filename[:-3])
+            changed = True
+        self.mtimes[name] = current
+        return changed
+
+    def load_registry(self) -> None:
+        module = self.systems_module
+        registry = module.Registry(module.load_system_pages())
+        mapped_systems: dict[str, list[str]] = {}
+        if MAPPINGS_FILE.exists():
+            mappings = json.loads(MAPPINGS_FILE.read_text(encoding='utf-8'))
+            for mapping in mappings.get('mappings', []):
+                mapped_systems.setdefault(mapping['issueId'], []).extend(as_list(mapping.get('systems')))
+        # Swap in only once everything parsed, so a failed reload keeps the old registry
+        self.registry, self.mapped_systems = registry, mapped_systems
+        # System ids may have shifted: re-index every issue from its stored names
+        self.indexes['system'] = defaultdict(set)
+        for record in self.issues.values():
+            record['systems'] = self.system_slugs(record)
+            for slug in record['systems']:
+                self.indexes['system'][slug].add(record['id'])
+
+    def system_slugs(self, record: dict) -> list[str]:
+        # lookup(), not resolve(): serving must never grow the registry's alias or unresolved tables
+        names = record['affectedSystems'] + self.mapped_systems.get(record['id'], [])
+        ids = {self.registry.lookup(name) for raw in names for name in self.systems_module.split_names(raw)}
+        return [system['slug'] for system in self.registry.systems if system['id'] in ids]
+
+    def index_issue(self, frontmatter: dict, stem: str) -> str:
+        issue_id = str(frontmatter.get('id', stem))
+        record = {
+            'id': issue_id,
+            'title': str(frontmatter.get('title', issue_id)),
+            'urgency': frontmatter.get('urgency'),
+            'category': [str(c) for c in as_list(frontmatter.get('category'))],
+            'tags': [str(t) for t in as_list(frontmatter.get('tags'))],
+            'mechanics': [str(m) for m in as_list(frontmatter.get('mechanics'))],
+            'primitives': [kebab(p) for p in as_list(frontmatter.get('primitives'))],
+            'affectedSystems': [str(s) for s in as_list(frontmatter.get('affectedSystems'))],
+            'connections': [str(c) for c in as_list(frontmatter.get('connections'))],
+            'publicConcern': frontmatter.get('publicConcern'),
+            'economicImpact': frontmatter.get('economicImpact'),
+            'socialImpact': frontmatter.get('socialImpact'),
+            'mergedInto': frontmatter.get('mergedInto'),
+        }
+        record['systems'] = self.system_slugs(record)
+        self.issues[issue_id] = record
+        for key in self.issue_keys(record):
+            self.indexes[key[0]][key[1]].add(issue_id)
+        return issue_id
+
+    def drop_issue(self, issue_id: str) -> None:
+        record = self.issues.pop(issue_id, None)
+        if record is None:
+            return
+        for index, key in self.issue_keys(record):
+            ids = self.indexes[index].get(key)
+            if ids is not None:
+                ids.discard(issue_id)
+                if not ids:
+                    del self.indexes[index][key]
+
+    @staticmethod
+    def issue_keys(record: dict):
+        for mechanic in record['mechanics']:
+            for key in mechanic_keys(mechanic):
+                yield 'mechanic', key
+        for slug in record['systems']:
+            yield 'system', slug
+        for category in record['category']:
+            yield 'category', category.casefold()
+        for primitive in record['primitives']:
+            yield 'primitive', primitive
+        for tag in record['tags']:
+            yield 'tag', tag.casefold()
+
+    def index_principle(self, frontmatter: dict, stem: str) -> str:
+        principle_id = str(frontmatter.get('id', stem))
+        source = self.systems_module.WALK_SOURCE.match(str(frontmatter.get('source', '')))
+        walk = str(frontmatter.get('system', '')).split(':', 1)[0].strip()
+        record = {
+            'id': principle_id,
+            'name': str(frontmatter.get('name', principle_id)),
+            'system': frontmatter.get('system'),
+            'walk': self.systems_module.normalize_walk(walk) if walk else None,
+            'sourceIssue': source.group(1) if source else None,
+        }
+        self.principles[principle_id] = record
+        if record['sourceIssue']:
+            self.by_source[record['sourceIssue']].add(principle_id)
+        if record['walk']:
+            self.by_walk[record['walk']].add(principle_id)
+        return principle_id
+
+    def drop_principle(self, principle_id: str) -> None:
+        record = self.principles.pop(principle_id, None)
+        if record is None:
+            return
+        self.by_source.get(record['sourceIssue'], set()).discard(principle_id)
+        self.by_walk.get(record['walk'], set()).discard(principle_id)
+
+    def load_connections(self) -> None:
+        outgoing: dict[str, list[dict]] = {}
+        incoming: dict[str, list[dict]] = {}
+        if CONNECTIONS_FILE.exists():
+            for conn in json.loads(CONNECTIONS_FILE.read_text(encoding='utf-8')).get('connections', []):
+                for target in conn['connectedTo']:
+                    edge = {key: target.get(key) for key in ('targetId', 'relationshipType', 'reasoning')}
+                    outgoing.setdefault(conn['issueId'], []).append(edge)
+                    incoming.setdefault(target.get('targetId', ''), []).append(
+                        {'sourceId': conn['issueId'], 'relationshipType': edge['relationshipType'],
+                         'reasoning': edge['reasoning']})
+        self.outgoing, self.incoming = outgoing, incoming
+
+    # --- Queries ------------------------------------------------------------
+
+    def resolve_key(self, index: str, value: str) -> str:
+        if index == 'system':
+            system_id = self.registry.lookup(value)
+            if system_id is None:
+                raise QueryError(HTTPStatus.NOT_FOUND, f"unknown system {value!r}")
+            return self.registry.systems[system_id]['slug']
+        if index == 'primitive':
+            return kebab(value)
+        if index in ('category', 'tag'):
+            return value.casefold()
+        return value
+
+    def summary(self, issue_id: str) -> dict:
+        record = self.issues[issue_id]
+        return {key: record[key] for key in ('id', 'title', 'urgency', 'category', 'systems')}
+
+    def find_issues(self, params: dict[str, str]) -> dict:
+        limit = int(params.pop('limit', 0) or 0)
+        unknown = params.keys() - set(INDEXES)
+        if unknown:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f"unknown filter(s): {', '.join(sorted(unknown))}")
+        matches: set[str] | None = None
+        # Intersect smallest posting set first
+        postings = sorted(
+            (self.indexes[index].get(self.resolve_key(index, value), set()) for index, value in params.items()),
+            key=len,
+        )
+        for ids in postings:
+            matches = set(ids) if matches is None else matches & ids
+            if not matches:
+                break
+        ids = sorted(self.issues if matches is None else matches)
+        return {'count': len(ids), 'issues': [self.summary(i) for i in ids[:limit or None]]}
+
+    def issue(self, issue_id: str) -> dict:
+        if issue_id not in self.issues:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"unknown issue {issue_id!r}")
+        record = dict(self.issues[issue_id])
+        record['links'] = self.connections(issue_id)
+        record['principles'] = sorted(self.by_source.get(issue_id, ()))
+        return record
+
+    def connections(self, issue_id: str) -> dict:
+        if issue_id not in self.issues and issue_id not in self.outgoing and issue_id not in self.incoming:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"unknown issue {issue_id!r}")
+        return {
+            'outgoing': self.outgoing.get(issue_id, []),
+            'incoming': self.incoming.get(issue_id, []),
+            'frontmatter': self.issues.get(issue_id, {}).get('connections', []),
+        }
+
+    def find_principles(self, params: dict[str, str]) -> dict:
+        ids: set[str] | None = None
+        if 'issue' in params:
+            ids = set(self.by_source.get(params['issue'], ()))
+        if 'walk' in params:
+            walk_ids = self.by_walk.get(self.systems_module.normalize_walk(params['walk']), set())
+            ids = set(walk_ids) if ids is None else ids & walk_ids
+        candidates = self.principles.keys() if ids is None else ids
+        if 'q' in params:
+            needle = params['q'].casefold()
+            candidates = [p for p in candidates if needle in self.principles[p]['name'].casefold()]
+        found = sorted(candidates)
+        limit = int(params.get('limit', 0) or 0)
+        return {'count': len(found), 'principles': [self.principles[p] for p in found[:limit or None]]}
+
+    def facets(self, index: str) -> dict:
+        if index not in self.indexes:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"unknown index {index!r}; try {', '.join(INDEXES)}")
+        counts = Counter({key: len(ids) for key, ids in self.indexes[index].items() if ids})
+        return {'index': index, 'keys': dict(counts.most_common())}
+
+    def health(self) -> dict:
+        return {
+            'status': 'ok',
+            'generation': self.generation,
+            'issues': len(self.issues),
+            'principles': len(self.principles),
+            'connections': sum(len(edges) for edges in self.outgoing.values()),
+            'indexKeys': {name: len(index) for name, index in self.indexes.items()},
+            'unreadable': dict(sorted(self.unreadable.items())),
+        }
+
+
+class QueryService:
+    """Routes request paths to Corpus queries, with throttled refresh and an LRU of encoded answers."""
+
+    def __init__(self, corpus: Corpus, cache_size: int, interval: float):
+        self.corpus = corpus
+        self.cache = LRUCache(cache_size)
+        self.interval = interval
+        self.checked_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def maybe_refresh(self) -> None:
+        now = time.monotonic()
+        if now - self.checked_at < self.interval:
+            return
+        self.checked_at = now
+        if self.corpus.refresh():
+            self.cache.clear()
+
+    def answer(self, target: str) -> tuple[HTTPStatus, bytes]:
+        parts = urlsplit(target)
+        path = unquote(parts.path).rstrip('/') or '/'
+        params = dict(parse_qsl(parts.query))
+        with self.lock:
+            key = (path, tuple(sorted(params.items())))
+            try:
+                self.maybe_refresh()
+                if path != '/health':
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        return HTTPStatus.OK, cached
+                body = json.dumps(self.route(path, params), ensure_ascii=False).encode('utf-8')
+            except QueryError as error:
+                return error.status, json.dumps({'error': str(error)}).encode('utf-8')
+            except ValueError as error:
+                return HTTPStatus.BAD_REQUEST, json.dumps({'error': str(error)}).encode('utf-8')
+            except Exception as error:
+                # Never drop the connection: report anything unexpected as JSON
+                return HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps(
+                    {'error': f"{type(error).__name__}: {error}"}).encode('utf-8')
+            if path != '/health':
+                self.cache.put(key, body)
+            return HTTPStatus.OK, body
+
+    def route(self, path: str, params: dict[str, str]):
+        corpus = self.corpus
+        segments = path.strip('/').split('/')
+        if path == '/health':
+            return {**corpus.health(), 'cache': {
+                'entries': len(self.cache.entries), 'hits': self.cache.hits, 'misses': self.cache.misses,
+            }}
+        if segments[0] == 'issues' and len(segments) == 1:
+            return corpus.find_issues(params)
+        if segments[0] == 'issues' and len(segments) == 2:
+            return corpus.issue(segments[1])
+        if segments[0] == 'connections' and len(segments) == 2:
+            return corpus.connections(segments[1])
+        if segments[0] == 'principles' and len(segments) == 1:
+            return corpus.find_principles(params)
+        if segments[0] == 'facets' and len(segments) == 2:
+            return corpus.facets(segments[1])
+        raise QueryError(HTTPStatus.NOT_FOUND, f"no route for {path}")
+
+
+def make_handler(service: QueryService, quiet: bool):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            start = time.perf_counter()
+            status, body = service.answer(self.path)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-Query-Ms', f"{(time.perf_counter() - start) * 1000:.2f}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between file change checks')
+    parser.add_argument('--cache-size', type=int, default=512, help='cached answers kept')
+    parser.add_argument('--quiet', action='store_true', help='no per-request log lines')
+    parser.add_argument('--query', help='answer one request path on stdout and exit')
+    args = parser.parse_args()
+
+    if not ISSUES_DIR.exists():
+        print(f"Error: {ISSUES_DIR} not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    corpus = Corpus()
+    service = QueryService(corpus, args.cache_size, args.interval)
+
+    if args.query:
+        status, body = service.answer(args.query)
+        print(json.dumps(json.loads(body), indent=2, ensure_ascii=False))
+        sys.exit(0 if status == HTTPStatus.OK else 1)
+
+    print(f"✓ Loaded {len(corpus.issues)} issues and {len(corpus.principles)} principles "
+          f"in {time.perf_counter() - start:.2f}s")
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(service, args.quiet))
+    print(f"✓ Serving on http://127.0.0.1:{args.port} (try /health, /issues?mechanic=threshold)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
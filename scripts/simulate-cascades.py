@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo simulation of how shocks cascade through the issue graph.
+
+Independent-cascade model over the typed edges in
+issue-issue-connections.json: when an issue activates, it gets one chance
+to activate each neighbour, with probability
+
+    edge-type probability × urgency factor of the target
+
+Causal and sequential edges point from issueId to targetId; reinforcing
+and thematic edges work both ways. Every issue is shocked in turn.
+Connection ids that are aliases or merged issues are mapped to their
+canonical id through issueIdRedirects in public/data.json, when it has
+been built.
+
+All trials run at once, bit-parallel: the state of an issue across
+--trials trials is one Python int with one bit per trial, and one edge
+step is a big-int AND/OR covering every trial. Each edge's coin flips are
+drawn once up front as a live-edge mask (bit t set if the edge fires in
+trial t), built from random words combined along the binary digits of its
+probability (--precision bits); every shocked issue is then run against
+the same sampled worlds, so the cascade itself needs no random numbers.
+The adjacency is array-backed (CSR offsets/targets/probabilities).
+Per-trial cascade sizes are tallied in a bit-sliced counter, so the chance
+of a large cascade is read off with bitwise compares instead of unpacking
+trials.
+
+Writes data/issue-cascades.json: per issue, the expected cascade size and
+impact-weighted size when it is shocked, the chance of a cascade of at
+least --large issues, the issues it most often reaches, and its
+activation probability when the shock lands on an issue picked in
+proportion to publicConcern.
+
+Run from anywhere: python3 scripts/simulate-cascades.py [--trials 4096] [--seed 1] [--edge-prob causal=0.4]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from array import array
+from collections import defaultdict
+
+from wiki_corpus import (
+    ROOT, WIKI_DIR, load_issue_redirects, now_iso, parse_frontmatter, resolve_issue_id, write_artifact,
+)
+
+ISSUES_DIR = WIKI_DIR / "issues"
+CONNECTIONS_FILE = ROOT / "issue-issue-connections.json"
+OUTPUT_FILE = ROOT / "data" / "issue-cascades.json"
+
+EDGE_PROBABILITIES = {
+    'causal': 0.35,
+    'sequential': 0.30,
+    'reinforcing': 0.25,
+    'thematic': 0.05,
+}
+DIRECTED_TYPES = {'causal', 'sequential'}
+URGENCY_FACTORS = {'low': 0.6, 'medium': 0.8, 'high': 1.0, 'critical': 1.2}
+# Defaults for missing scores, as in extract-data.ts
+PERCENT_FALLBACKS = {'publicConcern': 70, 'economicImpact': 60, 'socialImpact': 60}
+
+
+def percent(frontmatter: dict, field: str) -> float:
+    """0-10 and 0-100 scores both appear in frontmatter; same rules as normalizePercentLike in extract-data.ts."""
+    value = frontmatter.get(field)
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or math.isnan(value):
+        return float(PERCENT_FALLBACKS[field])
+    scaled = value * 10 if value <= 10 else value
+    return max(0.0, min(100.0, float(math.floor(scaled + 0.5))))  # Math.round
+
+
+def load_issues() -> dict[str, dict]:
+    issues: dict[str, dict] = {}
+    for path in sorted(ISSUES_DIR.glob('*.md')):
+        if path.name.startswith('_'):
+            continue
+        frontmatter, _ = parse_frontmatter(path.read_text(encoding='utf-8'))
+        issue_id = str(frontmatter.get('id', path.stem))
+        urgency = str(frontmatter.get('urgency', 'medium')).strip().lower()
+        issues[issue_id] = {
+            'urgency': URGENCY_FACTORS.get(urgency, URGENCY_FACTORS['medium']),
+            'concern': percent(frontmatter, 'publicConcern'),
+            'impact': (percent(frontmatter, 'economicImpact') + percent(frontmatter, 'socialImpact')) / 200,
+        }
+    return issues
+
+
+class Graph:
+    """CSR adjacency: out-edges of node i are targets[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, ids: list[str], edges: dict[tuple[int, int], float]):
+        self.ids = ids
+        by_source: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for (source, target), probability in sorted(edges.items()):
+            by_source[source].append((target, probability))
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        self.probabilities = array('d')
+        for node in range(len(ids)):
+            for target, probability in by_source[node]:
+                self.targets.append(target)
+                self.probabilities.append(probability)
+            self.offsets.append(len(self.targets))
+
+
+def build_graph(issues: dict[str, dict], edge_probabilities: dict[str, float],
+                redirects: dict[str, str] | None = None) -> tuple[Graph, dict]:
+    ids = sorted(issues)
+    position = {issue_id: i for i, issue_id in enumerate(ids)}
+    edges: dict[tuple[int, int], float] = {}
+    skipped = defaultdict(int)
+
+    def canonical(issue_id: str) -> str:
+        return issue_id if issue_id in position else resolve_issue_id(issue_id, redirects or {})
+
+    def add(source: str, target: str, base: float) -> None:
+        if source == target:
+            return
+        key = (position[source], position[target])
+        probability = min(1.0, base * issues[target]['urgency'])
+        # Parallel edges of different types: the pair fires if either does
+        edges[key] = 1 - (1 - edges.get(key, 0.0)) * (1 - probability)
+
+    data = json.loads(CONNECTIONS_FILE.read_text(encoding='utf-8'))
+    for conn in data['connections']:
+        source = canonical(conn['issueId'])
+        for link in conn['connectedTo']:
+            target = canonical(link.get('targetId', ''))
+            kind = link.get('relationshipType') or 'thematic'
+            if source not in position or target not in position:
+                skipped['unknownIssue'] += 1
+                continue
+            if kind not in edge_probabilities:
+                skipped[f"type:{kind}"] += 1
+                continue
+            add(source, target, edge_probabilities[kind])
+            if kind not in DIRECTED_TYPES:
+                add(target, source, edge_probabilities[kind])
+    return Graph(ids, edges), dict(skipped)
+
+
+def bernoulli(rng: random.Random, p: float, trials: int, precision: int) -> int:
+    """
+    A trials-bit mask with each bit set with probability p (to `precision`
+    binary digits): fold random words over p's digits from least to most
+    significant, OR for a 1 digit and AND for a 0.
+    """
+    level = round(p * (1 << precision))
+    if level <= 0:
+        return 0
+    if level >= 1 << precision:
+        return (1 << trials) - 1
+    while not level & 1:
+        level >>= 1
+        precision -= 1
+    mask = 0
+    for digit in range(precision):
+        word = rng.getrandbits(trials)
+        mask = (mask | word) if (level >> digit) & 1 else (mask & word)
+    return mask
+
+
+def add_plane(counter: list[int], plane: int) -> None:
+    """Add one bit per trial into a bit-sliced counter (least significant plane first)."""
+    carry = plane
+    for i in range(len(counter)):
+        if not carry:
+            return
+        counter[i], carry = counter[i] ^ carry, counter[i] & carry
+    if carry:
+        counter.append(carry)
+
+
+def at_least(counter: list[int], k: int, all_trials: int) -> int:
+    """Mask of trials whose count is ≥ k."""
+    if k <= 0:
+        return all_trials
+    if k >> len(counter):
+        return 0
+    greater, equal = 0, all_trials
+    for i in reversed(range(len(counter))):
+        if (k >> i) & 1:
+            equal &= counter[i]
+        else:
+            greater |= equal & counter[i]
+            equal &= ~counter[i]
+    return (greater | equal) & all_trials
+
+
+def sample_live_edges(graph: Graph, rng: random.Random, trials: int, precision: int) -> list[int]:
+    """One mask per edge: the trials in which that edge fires."""
+    return [bernoulli(rng, p, trials, precision) for p in graph.probabilities]
+
+
+def simulate(graph: Graph, live: list[int], source: int, all_trials: int) -> list[int]:
+    """Activation mask per node for a shock at `source`, all trials at once."""
+    active = [0] * len(graph.ids)
+    active[source] = all_trials
+    frontier = {source: all_trials}
+    offsets, targets = graph.offsets, graph.targets
+    while frontier:
+        reached: dict[int, int] = {}
+        for node, fresh in frontier.items():
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                hit = fresh & live[edge] & ~active[target]
+                if hit:
+                    active[target] |= hit
+                    reached[target] = reached.get(target, 0) | hit
+        frontier = reached
+    return active
+
+
+def parse_edge_probabilities(overrides: list[str]) -> dict[str, float]:
+    probabilities = dict(EDGE_PROBABILITIES)
+    for item in overrides:
+        kind, _, value = item.partition('=')
+        try:
+            probabilities[kind.strip()] = float(value)
+        except ValueError:
+            raise SystemExit(f"Error: --edge-prob expects type=probability, got {item!r}")
+    return probabilities
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trials', type=int, default=4096, help='Monte Carlo trials per shocked issue')
+    parser.add_argument('--seed', type=int, default=1, help='random seed')
+    parser.add_argument('--precision', type=int, default=10, help='binary digits of each edge probability')
+    parser.add_argument('--edge-prob', action='append', default=[], metavar='TYPE=P',
+                        help=f"override an edge-type probability (defaults: "
+                             f"{', '.join(f'{k}={v}' for k, v in EDGE_PROBABILITIES.items())})")
+    parser.add_argument('--large', type=int, default=10, help='cascade size counted as large')
+    parser.add_argument('--top', type=int, default=5, help='most-reached issues kept per shocked issue')
+    parser.add_argument('--output', default=str(OUTPUT_FILE), help='artifact path')
+    args = parser.parse_args()
+
+    if not ISSUES_DIR.exists() or not CONNECTIONS_FILE.exists():
+        print(f"Error: {ISSUES_DIR} or {CONNECTIONS_FILE} not found.")
+        sys.exit(1)
+
+    edge_probabilities = parse_edge_probabilities(args.edge_prob)
+    redirects = load_issue_redirects()
+    if redirects is None:
+        print("⚠ public/data.json not found (run pnpm extract-data); connections to issue aliases are skipped")
+    issues = load_issues()
+    graph, skipped = build_graph(issues, edge_probabilities, redirects)
+    ids = graph.ids
+    trials = args.trials
+    all_trials = (1 << trials) - 1
+    concern_total = sum(issues[i]['concern'] for i in ids) or 1.0
+
+    start = time.perf_counter()
+    live = sample_live_edges(graph, random.Random(args.seed), trials, args.precision)
+    results: dict[str, dict] = {}
+    exposure = [0.0] * len(ids)
+    for source, source_id in enumerate(ids):
+        active = simulate(graph, live, source, all_trials)
+
+        counter: list[int] = []
+        reach = []
+        weight = issues[source_id]['concern'] / concern_total
+        for node, mask in enumerate(active):
+            if not mask:
+                continue
+            add_plane(counter, mask)
+            probability = mask.bit_count() / trials
+            exposure[node] += weight * probability
+            if node != source:
+                reach.append((probability, ids[node]))
+
+        size = sum(p for p, _ in reach) + 1
+        impact = sum(p * issues[node]['impact'] for p, node in reach) + issues[source_id]['impact']
+        reach.sort(key=lambda pn: (-pn[0], pn[1]))
+        results[source_id] = {
+            'expectedCascadeSize': round(size, 3),
+            'expectedImpact': round(impact, 3),
+            'largeCascadeProbability': round(at_least(counter, args.large, all_trials).bit_count() / trials, 4),
+            'reachable': len(reach),
+            'mostReached': [[node, round(p, 4)] for p, node in reach[:args.top]],
+        }
+    elapsed = time.perf_counter() - start
+
+    for node, issue_id in enumerate(ids):
+        results[issue_id]['activationProbability'] = round(exposure[node], 4)
+
+    artifact = {
+        'generatedAt': now_iso(),
+        'parameters': {
+            'trials': trials, 'seed': args.seed, 'precision': args.precision, 'large': args.large,
+            'edgeProbabilities': edge_probabilities, 'urgencyFactors': URGENCY_FACTORS,
+        },
+        'stats': {
+            'issues': len(ids),
+            'edges': len(graph.targets),
+            'skippedConnections': skipped,
+        },
+        'issues': results,
+    }
+    write_artifact(args.output, artifact, separators=(',', ':'))
+
+    print(f"✓ {len(ids)} issues, {len(graph.targets)} directed edges, {trials} trials each ({elapsed:.1f}s)")
+    if skipped:
+        print(f"  skipped connections: {', '.join(f'{k}={v}' for k, v in sorted(skipped.items()))}")
+    print("\nLargest expected cascades:")
+    for issue_id, result in sorted(results.items(), key=lambda r: -r[1]['expectedCascadeSize'])[:10]:
+        print(f"  {result['expectedCascadeSize']:7.2f}  P(≥{args.large})={result['largeCascadeProbability']:.3f}  {issue_id}")
+    print("\nMost exposed issues:")
+    for issue_id, result in sorted(results.items(), key=lambda r: -r[1]['activationProbability'])[:10]:
+        print(f"  {result['activationProbability']:.3f}  {issue_id}")
+    print(f"\n✓ Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-stage timing for the Python maintenance scripts.
+
+    profiler = StageProfiler()
+    with profiler.stage('read', file=slug):
+        ...
+    profiler.report()
+
+A disabled profiler (NULL_PROFILER) hands back a shared no-op context, so
+scripts can thread one through unconditionally. Optionally records a
+Chrome trace (chrome://tracing / Perfetto) and wraps a cProfile run.
+"""
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import time
+from collections import defaultdict
+
+_NOOP = contextlib.nullcontext()
+
+
+class StageProfiler:
+    def __init__(self, enabled: bool = True, trace: bool = False):
+        self.enabled = enabled
+        self.trace = trace
+        self.totals: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+        self.per_file: dict[str, float] = defaultdict(float)
+        self.events: list[dict] = []
+        self.origin = time.perf_counter()
+        self.cprofile: cProfile.Profile | None = None
+
+    def stage(self, name: str, file: str | None = None):
+        if not self.enabled:
+            return _NOOP
+        return self._timed(name, file)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str, file: str | None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed
+            self.counts[name] += 1
+            if file is not None:
+                self.per_file[file] += elapsed
+            if self.trace:
+                event = {
+                    "name": name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": round((start - self.origin) * 1e6, 1),
+                    "dur": round(elapsed * 1e6, 1),
+                    "pid": os.getpid(),
+                    "tid": 0,
+                }
+                if file is not None:
+                    event["args"] = {"file": file}
+                self.events.append(event)
+
+    def start_cprofile(self) -> None:
+        self.cprofile = cProfile.Profile()
+        self.cprofile.enable()
+
+    def stop_cprofile(self, path: str) -> None:
+        if self.cprofile is None:
+            return
+        self.cprofile.disable()
+        self.cprofile.dump_stats(path)
+        print(f"\n=== cProfile (top 15 by cumulative time, full dump: {path}) ===")
+        pstats.Stats(self.cprofile).sort_stats('cumulative').print_stats(15)
+
+    def write_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        print(f"✓ Wrote {len(self.events)} trace events to {path}")
+
+    def report(self, top: int = 10) -> None:
+        if not self.enabled:
+            return
+        wall = time.perf_counter() - self.origin
+        staged = sum(self.totals.values())
+
+        print(f"\n=== Profile ({wall:.3f}s wall, {staged:.3f}s in stages) ===")
+        print(f"  {'stage':<12} {'total s':>9} {'share':>7} {'calls':>7} {'avg ms':>9}")
+        for name, total in sorted(self.totals.items(), key=lambda x: -x[1]):
+            calls = self.counts[name]
+            share = total / staged * 100 if staged else 0
+            print(f"  {name:<12} {total:9.4f} {share:6.1f}% {calls:7d} {total / calls * 1000:9.3f}")
+
+        if self.per_file:
+            print(f"\nSlowest files:")
+            for file, total in sorted(self.per_file.items(), key=lambda x: -x[1])[:top]:
+                print(f"  {total * 1000:8.2f} ms  {file}")
+
+
+NULL_PROFILER = StageProfiler(enabled=False)
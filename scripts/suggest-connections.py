@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Suggest issue-issue connections that are not in the graph yet.
+
+Builds sparse TF-IDF vectors (sublinear tf, smoothed idf, L2-normalized)
+for every wiki/issues page and scores all pairs at once as a sparse
+matrix product X·Xᵀ, accumulated through the term → posting lists, the
+same way a CSR × CSC multiply walks its nonzeros. Text cosine is blended
+with mechanics overlap and affectedSystems overlap; the systems overlap
+uses the system bitmasks in data/system-registry.json when present.
+
+Pairs already linked in issue-issue-connections.json or in a page's
+`connections:` frontmatter (either direction) are skipped. The top-k
+suggestions per issue are written as a review file shaped like
+issue-issue-connections.json, with relationshipType and reasoning left
+empty for a curator to fill in.
+
+Run from anywhere: python3 scripts/suggest-connections.py [--k 5] [--output connection-suggestions.json]
+"""
+import argparse
+import heapq
+import json
+import math
+import sys
+from collections import Counter, defaultdict
+
+from wiki_corpus import ROOT, WIKI_DIR, as_list, content_words, now_iso, parse_frontmatter
+
+ISSUES_DIR = WIKI_DIR / "issues"
+CONNECTIONS_FILE = ROOT / "issue-issue-connections.json"
+REGISTRY_FILE = ROOT / "data" / "system-registry.json"
+OUTPUT_FILE = ROOT / "connection-suggestions.json"
+
+
+def load_issues() -> dict[str, dict]:
+    issues: dict[str, dict] = {}
+    for path in sorted(ISSUES_DIR.glob('*.md')):
+        if path.name.startswith('_'):
+            continue
+        frontmatter, body = parse_frontmatter(path.read_text(encoding='utf-8'))
+        issue_id = str(frontmatter.get('id', path.stem))
+        title = str(frontmatter.get('title', issue_id))
+        issues[issue_id] = {
+            'title': title,
+            'terms': Counter(content_words(f"{title} {title} {body}")),
+            'mechanics': {str(m) for m in as_list(frontmatter.get('mechanics'))},
+            'systems': {str(s).strip().lower() for s in as_list(frontmatter.get('affectedSystems'))},
+            'connections': {str(c) for c in as_list(frontmatter.get('connections'))},
+        }
+    return issues
+
+
+def existing_pairs(issues: dict[str, dict]) -> set[tuple[str, str]]:
+    pairs: set[tuple[str, str]] = set()
+    for issue_id, issue in issues.items():
+        for target in issue['connections']:
+            pairs.add(tuple(sorted((issue_id, target))))
+    if CONNECTIONS_FILE.exists():
+        for conn in json.loads(CONNECTIONS_FILE.read_text(encoding='utf-8')).get('connections', []):
+            for target in conn['connectedTo']:
+                pairs.add(tuple(sorted((conn['issueId'], target.get('targetId', '')))))
+    return pairs
+
+
+def system_masks(issues: dict[str, dict]) -> dict[str, int] | None:
+    """Per-issue system bitmasks from the registry, or None to fall back to name sets."""
+    if not REGISTRY_FILE.exists():
+        return None
+    masks = json.loads(REGISTRY_FILE.read_text(encoding='utf-8')).get('issues', {})
+    # Stored as 32-bit words, least significant first
+    return {
+        issue_id: sum(word << (32 * i) for i, word in enumerate(masks.get(issue_id, [])))
+        for issue_id in issues
+    }
+
+
+def tfidf_vectors(issues: dict[str, dict], min_df: int, max_df: float) -> tuple[dict[str, dict[str, float]], dict]:
+    """Sparse rows {term: weight}, plus the term → [(issue, weight)] posting lists (the transposed matrix)."""
+    n = len(issues)
+    df = Counter(term for issue in issues.values() for term in issue['terms'])
+    vocabulary = {term for term, count in df.items() if min_df <= count <= max_df * n}
+
+    rows: dict[str, dict[str, float]] = {}
+    postings: dict[str, list[tuple[str, float]]] = defaultdict(list)
+    for issue_id, issue in issues.items():
+        row = {
+            term: (1 + math.log(tf)) * (math.log((n + 1) / (df[term] + 1)) + 1)
+            for term, tf in issue['terms'].items()
+            if term in vocabulary
+        }
+        norm = math.sqrt(sum(w * w for w in row.values())) or 1.0
+        row = {term: w / norm for term, w in row.items()}
+        rows[issue_id] = row
+        for term, weight in row.items():
+            postings[term].append((issue_id, weight))
+    return rows, postings
+
+
+def overlap(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def mask_overlap(a: int, b: int) -> float:
+    union = a | b
+    return (a & b).bit_count() / union.bit_count() if union else 0.0
+
+
+def suggest(issues: dict[str, dict], args) -> tuple[list[dict], int]:
+    rows, postings = tfidf_vectors(issues, args.min_df, args.max_df)
+    linked = existing_pairs(issues)
+    masks = system_masks(issues)
+
+    suggestions: list[dict] = []
+    scored_pairs = 0
+    for issue_id, row in rows.items():
+        # One row of X·Xᵀ: accumulate dot products over shared terms only
+        dots: dict[str, float] = defaultdict(float)
+        for term, weight in row.items():
+            for other, other_weight in postings[term]:
+                dots[other] += weight * other_weight
+
+        candidates = []
+        for other, cosine in dots.items():
+            if other == issue_id or tuple(sorted((issue_id, other))) in linked:
+                continue
+            mechanics = overlap(issues[issue_id]['mechanics'], issues[other]['mechanics'])
+            if masks is not None:
+                systems = mask_overlap(masks[issue_id], masks[other])
+            else:
+                systems = overlap(issues[issue_id]['systems'], issues[other]['systems'])
+            score = args.text_weight * cosine + args.mechanics_weight * mechanics + args.systems_weight * systems
+            candidates.append((score, other, cosine, mechanics, systems))
+        scored_pairs += len(candidates)
+
+        top = [c for c in heapq.nlargest(args.k, candidates) if c[0] >= args.min_score]
+        if not top:
+            continue
+        suggestions.append({
+            'issueId': issue_id,
+            'issueName': issues[issue_id]['title'],
+            'connectedTo': [
+                {
+                    'targetId': other,
+                    'targetName': issues[other]['title'],
+                    'relationshipType': None,
+                    'reasoning': '',
+                    'score': round(score, 4),
+                    'signals': {
+                        'text': round(cosine, 4),
+                        'mechanics': round(mechanics, 4),
+                        'systems': round(systems, 4),
+                    },
+                    'sharedTerms': [
+                        term for term, _ in heapq.nlargest(
+                            args.shared_terms,
+                            ((t, w * rows[other][t]) for t, w in row.items() if t in rows[other]),
+                            key=lambda tw: tw[1],
+                        )
+                    ],
+                }
+                for score, other, cosine, mechanics, systems in top
+            ],
+        })
+    return suggestions, scored_pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--k', type=int, default=5, help='suggestions per issue')
+    parser.add_argument('--min-score', type=float, default=0.1, help='drop suggestions scoring below this')
+    parser.add_argument('--min-df', type=int, default=2, help='ignore terms used by fewer pages')
+    parser.add_argument('--max-df', type=float, default=0.5, help='ignore terms used by more than this share of pages')
+    parser.add_argument('--text-weight', type=float, default=0.7)
+    parser.add_argument('--mechanics-weight', type=float, default=0.15)
+    parser.add_argument('--systems-weight', type=float, default=0.15)
+    parser.add_argument('--shared-terms', type=int, default=6, help='top shared terms listed per suggestion')
+    parser.add_argument('--output', default=str(OUTPUT_FILE), help='review file path')
+    args = parser.parse_args()
+
+    if not ISSUES_DIR.exists():
+        print(f"Error: {ISSUES_DIR} not found.")
+        sys.exit(1)
+
+    issues = load_issues()
+    suggestions, scored_pairs = suggest(issues, args)
+    total = sum(len(s['connectedTo']) for s in suggestions)
+
+    report = {
+        'metadata': {
+            'generatedAt': now_iso(),
+            'issues': len(issues),
+            'scoredPairs': scored_pairs,
+            'totalSuggestions': total,
+            'weights': {'text': args.text_weight, 'mechanics': args.mechanics_weight, 'systems': args.systems_weight},
+            'systemsSource': 'system-registry' if REGISTRY_FILE.exists() else 'affectedSystems',
+        },
+        'connections': suggestions,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ Scored {scored_pairs} unlinked pairs across {len(issues)} issues")
+    print(f"✓ Wrote {total} suggestions for {len(suggestions)} issues to {args.output}")
+    best = sorted(
+        ((t['score'], s['issueId'], t['targetId']) for s in suggestions for t in s['connectedTo']),
+        reverse=True,
+    )
+    seen: set[tuple[str, str]] = set()
+    print("\nTop suggestions:")
+    for score, source, target in best:
+        pair = tuple(sorted((source, target)))
+        if pair in seen:
+            continue
+        seen.add(pair)
+        print(f"  {score:.3f}  {source} ↔ {target}")
+        if len(seen) == 10:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Checks for scripts/run-pipeline.py against a throwaway tree.
+
+Three tiny stages in a temp root (a.txt → out/a.txt → out/c.txt, and
+b.txt → out/b.txt) are run through run(), with each command appending its
+name to runs.log, to check that:
+
+  - a second run with nothing changed runs nothing
+  - editing one input re-runs only that stage and the stages downstream of it
+  - a hand-edited output is restored from the object store, not re-run,
+    and the edited copy is kept in the store
+
+Run from anywhere: python3 scripts/test-run-pipeline.py
+"""
+import contextlib
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+from wiki_corpus import load_script
+
+pipeline = load_script('run-pipeline')
+
+STEP = (
+    "import pathlib, sys; name, src, dst = sys.argv[1:]; "
+    "pathlib.Path(dst).parent.mkdir(exist_ok=True); "
+    "pathlib.Path(dst).write_text(pathlib.Path(src).read_text().upper()); "
+    "open('runs.log', 'a').write(name + '\\n')"
+)
+
+
+def step(name: str, src: str, dst: str):
+    return pipeline.Stage(name=name, command=[pipeline.PY, "-c", STEP, name, src, dst], inputs=[src], outputs=[dst])
+
+
+STAGES = [
+    step('a', 'a.txt', 'out/a.txt'),
+    step('b', 'b.txt', 'out/b.txt'),
+    step('c', 'out/a.txt', 'out/c.txt'),
+]
+
+
+def use_root(root: Path) -> None:
+    pipeline.ROOT = root
+    pipeline.CACHE_DIR = root / ".pipeline-cache"
+    pipeline.STATE_FILE = pipeline.CACHE_DIR / "state.json"
+    pipeline.OBJECTS_DIR = pipeline.CACHE_DIR / "objects"
+
+
+def run_all(root: Path) -> list[str]:
+    """Run every stage; returns the names of the stages whose command actually ran."""
+    log = root / 'runs.log'
+    log.write_text('', encoding='utf-8')
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = pipeline.run(STAGES, pipeline.build_graph(STAGES), 1, False, False)
+    assert ok, "pipeline run failed"
+    return sorted(log.read_text(encoding='utf-8').split())
+
+
+def expect(label: str, actual, expected) -> None:
+    if actual != expected:
+        raise AssertionError(f"{label}: expected {expected!r}, got {actual!r}")
+    print(f"✓ {label}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        use_root(root)
+        (root / 'a.txt').write_text('alpha', encoding='utf-8')
+        (root / 'b.txt').write_text('beta', encoding='utf-8')
+
+        expect("first run runs every stage", run_all(root), ['a', 'b', 'c'])
+        expect("unchanged tree runs nothing", run_all(root), [])
+
+        (root / 'a.txt').write_text('alpha, edited', encoding='utf-8')
+        expect("editing a.txt re-runs a and its downstream c only", run_all(root), ['a', 'c'])
+        expect("downstream output reflects the edit",
+               (root / 'out' / 'c.txt').read_text(encoding='utf-8'), 'ALPHA, EDITED')
+
+        (root / 'out' / 'b.txt').write_text('hand edit', encoding='utf-8')
+        expect("hand-edited output is restored without re-running", run_all(root), [])
+        expect("restored output has the recorded content",
+               (root / 'out' / 'b.txt').read_text(encoding='utf-8'), 'BETA')
+        kept = [path.read_text(encoding='utf-8') for path in pipeline.OBJECTS_DIR.rglob('*') if path.is_file()]
+        expect("hand-edited content is kept in the object store", 'hand edit' in kept, True)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except AssertionError as error:
+        print(f"✗ {error}")
+        sys.exit(1)
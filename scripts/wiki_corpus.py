@@ -0,0 +1,174 @@
+"""
+Shared helpers for the Python maintenance scripts that read wiki/ pages.
+
+Only the small subset of YAML used by wiki frontmatter is supported:
+scalars, quoted strings, inline lists ([a, 'b']) and block lists (- item).
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+ROOT = SCRIPTS_DIR.parent
+WIKI_DIR = ROOT / "wiki"
+DATA_FILE = ROOT / "public" / "data.json"
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset(
+    "the and for with from that this are was were been into can has have not but its their "
+    "which while when where who what will would could should also more most than then they them "
+    "these those such other over under about between through after before during each only".split()
+)
+
+FRONTMATTER_PATTERN = re.compile(r'\A---\r?\n(.*?)\r?\n---\r?\n?', re.DOTALL)
+KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*):\s*(.*)$')
+INT_PATTERN = re.compile(r'^-?\d+$')
+
+
+def _parse_scalar(raw: str):
+    value = raw.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    if INT_PATTERN.match(value):
+        return int(value)
+    return value
+
+
+def _parse_inline_list(raw: str) -> list:
+    inner = raw.strip()[1:-1].strip()
+    if not inner:
+        return []
+    items: list = []
+    current = ''
+    quote = ''
+    for ch in inner:
+        if quote:
+            current += ch
+            if ch == quote:
+                quote = ''
+        elif ch in ('"', "'"):
+            quote = ch
+            current += ch
+        elif ch == ',':
+            items.append(_parse_scalar(current))
+            current = ''
+        else:
+            current += ch
+    if current.strip():
+        items.append(_parse_scalar(current))
+    return items
+
+
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    """Split a page into (frontmatter dict, body). Pages without frontmatter return ({}, content)."""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return {}, content
+
+    data: dict = {}
+    block_key = None
+    for line in match.group(1).splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if block_key and stripped.startswith('- '):
+            data[block_key].append(_parse_scalar(stripped[2:]))
+            continue
+        key_match = KEY_PATTERN.match(line)
+        if not key_match:
+            continue
+        key, raw = key_match.group(1), key_match.group(2).strip()
+        block_key = None
+        if raw == '':
+            data[key] = []
+            block_key = key
+        elif raw.startswith('[') and raw.endswith(']'):
+            data[key] = _parse_inline_list(raw)
+        else:
+            data[key] = _parse_scalar(raw)
+
+    return data, content[match.end():]
+
+
+def as_list(value) -> list:
+    """Normalize a frontmatter value that may be a scalar or a list."""
+    if value is None or value == '':
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def content_words(text: str) -> list[str]:
+    """Lowercased words of three or more letters, minus common stopwords."""
+    return [w for w in WORD_PATTERN.findall(text.lower()) if len(w) > 2 and w not in STOPWORDS]
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def now_iso() -> str:
+    """Timestamp in the same shape as JS `new Date().toISOString()`."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def write_artifact(path, data: dict, **dump_options) -> bool:
+    """
+    json.dump data to path, unless the file already holds the same bytes apart
+    from `generatedAt`: then it is left alone, so re-running a script on
+    unchanged inputs keeps the committed artifact clean. Returns whether the
+    file was written.
+    """
+    path = Path(path)
+    text = json.dumps(data, ensure_ascii=False, **dump_options)
+    try:
+        previous = path.read_text(encoding='utf-8')
+        stamp = json.loads(previous).get('generatedAt')
+    except (OSError, ValueError, AttributeError):
+        stamp = None
+    if stamp is not None and 'generatedAt' in data:
+        if json.dumps({**data, 'generatedAt': stamp}, ensure_ascii=False, **dump_options) == previous:
+            return False
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def load_issue_redirects(path: Path = DATA_FILE) -> dict[str, str] | None:
+    """
+    issueIdRedirects (alias or merged id → canonical id) from public/data.json,
+    or None when `pnpm extract-data` hasn't been run.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    return dict(data.get('issueIdRedirects') or {})
+
+
+def resolve_issue_id(issue_id: str, redirects: dict[str, str]) -> str:
+    """Follow redirects to the canonical id, as createIssueIdResolver does in src/main/dataLoad.ts."""
+    current = issue_id
+    visited: set[str] = set()
+    for _ in range(25):
+        target = redirects.get(current)
+        if not target or target == current or current in visited:
+            return current
+        visited.add(current)
+        current = target
+    return current
+
+
+def load_script(name: str):
+    """Import a hyphenated script such as apply-mechanics-tags.py as a module (its main() is not run)."""
+    path = SCRIPTS_DIR / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
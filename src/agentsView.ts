@@ -4,6 +4,7 @@ import { renderAgent } from './agentsView/renderAgent';
 import { escapeHtml, toTitleCaseWords } from './agentsView/formatting';
 import { downloadJson, humanizeAgentForExport } from './agentsView/exportUtils';
 import { loadRoster, saveRoster, type RosterItem } from './agentsView/rosterStorage';
+import { fetchArtifact } from './main/artifacts';
 
 const COGNITIVE_DETAILS_KEY = 'profile:cognitive:details';
 const PSYCHOLOGY_DETAILS_KEY = 'profile:psychology:details';
@@ -84,7 +85,7 @@ const measureAsyncSpan = async <T>(name: string, fn: () => Promise<T>, meta?: Re
 function getAgentVocabV1(): Promise<AgentVocabV1> {
   if (agentVocabPromise) return agentVocabPromise;
   agentVocabPromise = measureAsyncSpan('agents:load:vocab', async () => {
-    const res = await fetch('agent-vocab.v1.json', { cache: 'no-store' });
+    const res = await fetchArtifact('agent-vocab.v1.json', { cache: 'no-store' });
     if (!res.ok) throw new Error(`Failed to load agent vocab (${res.status})`);
     const parseStart = agentsPerfEnabled ? performance.now() : 0;
     const parsed = (await res.json()) as unknown;
@@ -100,7 +101,7 @@ function getAgentVocabV1(): Promise<AgentVocabV1> {
 function getAgentPriorsV1(): Promise<AgentPriorsV1> {
   if (agentPriorsPromise) return agentPriorsPromise;
   agentPriorsPromise = measureAsyncSpan('agents:load:priors', async () => {
-    const res = await fetch('agent-priors.v1.json', { cache: 'no-store' });
+    const res = await fetchArtifact('agent-priors.v1.json', { cache: 'no-store' });
     if (!res.ok) throw new Error(`Failed to load agent priors (${res.status})`);
     const parseStart = agentsPerfEnabled ? performance.now() : 0;
     const parsed = (await res.json()) as unknown;
@@ -116,7 +117,7 @@ function getAgentPriorsV1(): Promise<AgentPriorsV1> {
 function getShadowCountryMap(): Promise<Array<{ real: string; shadow: string; iso3?: string; continent?: string }>> {
   if (shadowCountryMapPromise) return shadowCountryMapPromise;
   shadowCountryMapPromise = measureAsyncSpan('agents:load:countries', async () => {
-    const res = await fetch('shadow-country-map.json', { cache: 'no-store' });
+    const res = await fetchArtifact('shadow-country-map.json', { cache: 'no-store' });
     if (!res.ok) throw new Error(`Failed to load shadow country map (${res.status})`);
     const parseStart = agentsPerfEnabled ? performance.now() : 0;
     const parsed = (await res.json()) as unknown;
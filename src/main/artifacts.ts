@@ -0,0 +1,47 @@
+type ArtifactsManifest = {
+  files?: Record<string, { file?: string }>;
+};
+
+let hashedNamesPromise: Promise<Record<string, string>> | null = null;
+
+// dist/artifacts-manifest.json (written by `pnpm finalize`) maps each JSON
+// artifact to a content-hashed copy. Loaded once per page; missing in dev.
+function loadHashedNames(fetcher: typeof fetch): Promise<Record<string, string>> {
+  if (hashedNamesPromise) return hashedNamesPromise;
+  hashedNamesPromise = (async () => {
+    try {
+      const res = await fetcher('/artifacts-manifest.json', { cache: 'no-store' });
+      if (!res.ok) return {};
+      const manifest = (await res.json()) as ArtifactsManifest;
+      const names: Record<string, string> = {};
+      for (const [name, entry] of Object.entries(manifest?.files ?? {})) {
+        if (typeof entry?.file === 'string') names[name] = entry.file;
+      }
+      return names;
+    } catch {
+      return {};
+    }
+  })();
+  return hashedNamesPromise;
+}
+
+/**
+ * Fetch a JSON artifact by its plain name ('/data.json', 'agent-vocab.v1.json').
+ * In a finalized build the content-hashed copy is fetched instead; it is served
+ * immutable, so repeat visits come from the browser cache. Without a manifest,
+ * or if the hashed copy fails, the plain name is fetched with `init`.
+ */
+export async function fetchArtifact(name: string, init?: RequestInit, fetcher: typeof fetch = fetch): Promise<Response> {
+  const prefix = name.startsWith('/') ? '/' : '';
+  const key = name.slice(prefix.length);
+  const hashed = (await loadHashedNames(fetcher))[key];
+  if (hashed) {
+    try {
+      const res = await fetcher(prefix + hashed);
+      if (res.ok) return res;
+    } catch {
+      // fall through to the plain name
+    }
+  }
+  return fetcher(name, init);
+}
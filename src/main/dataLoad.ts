@@ -1,4 +1,5 @@
 import type { GraphData } from '../types';
+import { fetchArtifact } from './artifacts';
 
 type DataLoadResult = {
   data: GraphData;
@@ -17,7 +18,7 @@ export async function loadGraphData(fetcher: typeof fetch = fetch): Promise<Data
   let dataLoadError: string | null = null;
 
   try {
-    const response = await fetcher('/data.json');
+    const response = await fetchArtifact('/data.json', undefined, fetcher);
     if (!response.ok) {
       throw new Error(`HTTP ${response.status} ${response.statusText}`.trim());
     }